@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Excel reader throughput per engine
+
+Generates workbooks of the given shapes (rows x columns of mixed int, float, text, date and numeric-looking text
+cells such as "00042") and reads them with every installed Excel engine of the validator, reporting MB/s of the
+file and rows/s, and whether each engine reads the same frame as the pandas engine. Use --project to read only
+the first N columns, like a run whose rules reference N columns.
+
+Usage: python benchmarks/bench_excel_engines.py [--shapes 50000x10 10000x60] [--project 0] [--repeat 3]
+"""
+
+import argparse
+import importlib.util
+import logging
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Run against the source tree when the package is not installed
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+import numpy as np
+import openpyxl
+import pandas as pd
+
+from validator import EXCEL_READERS
+
+
+def make_workbook(path: str, n_rows: int, n_cols: int, seed: int = 0) -> None:
+    """Write a workbook with one sheet 'data' of int, float, text, date and code text columns (in turn), with some empty cells."""
+    rng = np.random.default_rng(seed)
+    workbook = openpyxl.Workbook(write_only=True)
+    worksheet = workbook.create_sheet("data")
+    worksheet.append([f"col_{i}" for i in range(n_cols)])
+
+    start = datetime(2025, 1, 1)
+    columns = []
+    for i in range(n_cols):
+        kind = i % 5
+        if kind == 0:
+            values = rng.integers(0, 1000, n_rows).tolist()
+        elif kind == 1:
+            values = np.round(rng.random(n_rows) * 100, 2).tolist()
+        elif kind == 2:
+            values = [f"Brand {k}" for k in rng.integers(0, 50, n_rows)]
+        elif kind == 3:
+            values = [start + timedelta(days=int(k)) for k in rng.integers(0, 365, n_rows)]
+        else:
+            values = [f"{k:05d}" for k in rng.integers(0, 1000, n_rows)]  # Codes stored as text, read as numbers by pandas
+        empty = rng.random(n_rows) < 0.05
+        columns.append([None if is_empty else value for value, is_empty in zip(values, empty)])
+
+    for row in zip(*columns):
+        worksheet.append(row)
+    workbook.save(path)
+
+
+def best_of(func, repeat: int, *args) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure Excel reader throughput of each installed engine.")
+    parser.add_argument("--shapes", nargs="+", default=["50000x10", "10000x60"], help="Workbook shapes as ROWSxCOLUMNS")
+    parser.add_argument("--project", type=int, default=0, help="Read only the first N columns (0 = all columns)")
+    parser.add_argument("--repeat", type=int, default=3, help="Repetitions, the best timing is reported")
+    args = parser.parse_args()
+
+    engines = [engine for engine in EXCEL_READERS
+               if engine != "calamine" or importlib.util.find_spec("python_calamine") is not None]
+    if len(engines) < len(EXCEL_READERS):
+        print("python-calamine is not installed, skipping the calamine engine (pip install python-calamine)")
+    logger = logging.getLogger("bench_excel_engines")
+    logger.setLevel(logging.WARNING)  # The readers log projected columns at INFO level
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for shape in args.shapes:
+            n_rows, n_cols = map(int, shape.lower().split("x"))
+            path = os.path.join(temp_dir, f"bench {shape}.xlsx")
+            make_workbook(path, n_rows, n_cols)
+            size_mb = os.path.getsize(path) / (1024 * 1024)
+
+            rule = None
+            if args.project:
+                rule = pd.DataFrame({"column": [f"col_{i}" for i in range(min(args.project, n_cols))], "scope": ""})
+
+            print(f"\nWorkbook: {n_rows} rows x {n_cols} columns, {size_mb:.2f} MB"
+                  f"{f', reading {len(rule)} columns' if rule is not None else ''}")
+            expected = EXCEL_READERS["pandas"](path, "data", rule, logger)
+            for engine in engines:
+                seconds = best_of(EXCEL_READERS[engine], args.repeat, path, "data", rule, logger)
+                same = EXCEL_READERS[engine](path, "data", rule, logger).equals(expected)
+                print(f"{engine:<10} {seconds:8.3f} s {size_mb / seconds:8.2f} MB/s {n_rows / seconds:12,.0f} rows/s"
+                      f"{'' if same else '  DIFFERS from pandas'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Benchmark: import time of the validator module (CLI startup)
+
+Imports the validator in fresh interpreters with `python -X importtime`, reports the slowest imports and checks
+the total against a budget. Heavy libraries (pandas, NumPy, pyarrow, openpyxl, Cerberus) are imported lazily, on
+first use, so they should not show up at all. Exits with status 1 when the import is over budget or a heavy
+library is imported eagerly, so it can guard CI.
+
+Usage: python benchmarks/bench_import_time.py [--budget-ms 300] [--top 10] [--repeat 5]
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+
+# Libraries the validator must not import before they are needed
+HEAVY_MODULES = ("pandas", "numpy", "pyarrow", "openpyxl", "cerberus")
+
+IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|(\s+)(\S+)")
+
+
+def run_python(*args: str) -> subprocess.CompletedProcess:
+    """Run a fresh interpreter against the source tree."""
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [str(SRC_DIR), os.environ.get("PYTHONPATH")]))}
+    return subprocess.run([sys.executable, *args], env=env, capture_output=True, text=True, check=True)
+
+
+def measure_import() -> tuple:
+    """Import the validator once; returns (wall seconds of the interpreter, {module: cumulative µs}, modules it imports)."""
+    start = time.perf_counter()
+    result = run_python("-X", "importtime", "-c", "import validator")
+    wall = time.perf_counter() - start
+
+    # Imports are reported after the modules they import, nested ones indented two more spaces
+    cumulative = {}
+    children = []
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        _, cumulative_us, indent, name = match.groups()
+        cumulative[name] = int(cumulative_us)
+        if len(indent) == 1:
+            if name == "validator":
+                break
+            children = []
+        elif len(indent) == 3:
+            children.append(name)
+    return wall, cumulative, children
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the import time of the validator module against a budget.")
+    parser.add_argument("--budget-ms", type=float, default=300, help="Budget for importing the validator, in ms")
+    parser.add_argument("--top", type=int, default=10, help="Number of slowest imports to list")
+    parser.add_argument("--repeat", type=int, default=5, help="Repetitions, the best timing is reported")
+    args = parser.parse_args()
+
+    runs = [measure_import() for _ in range(args.repeat)]
+    wall, cumulative, imported = min(runs, key=lambda run: run[1]["validator"])
+    total_ms = cumulative["validator"] / 1000
+
+    print(f"Import of validator: {total_ms:.1f} ms (budget {args.budget_ms:.0f} ms), interpreter start + import: {wall * 1000:.0f} ms")
+    print("\nSlowest imports of validator by cumulative time:")
+    for name in sorted(imported, key=lambda name: cumulative[name], reverse=True)[:args.top]:
+        print(f"{cumulative[name] / 1000:8.1f} ms  {name}")
+
+    loaded = run_python("-c", f"import sys, validator; print(' '.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))").stdout.split()
+    if loaded:
+        print(f"\nImported eagerly: {', '.join(loaded)}")
+
+    over_budget = total_ms > args.budget_ms
+    print(f"\n{'OVER BUDGET' if over_budget or loaded else 'OK'}")
+    sys.exit(1 if over_budget or loaded else 0)
+
+
+if __name__ == "__main__":
+    main()
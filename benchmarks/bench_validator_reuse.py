@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Benchmark: per-partition overhead of Cerberus validation
+
+Compares building a new Cerberus Validator for every partition (the old behaviour) with borrowing a
+validator compiled once per rule from a ValidatorPool, on a daily-scoped rule.
+
+Usage: python benchmarks/bench_validator_reuse.py [--partitions 1000] [--allowed 50] [--repeat 3]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Run against the source tree when the package is not installed
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+import numpy as np
+from cerberus import Validator
+
+from validator import ValidatorPool
+
+
+def make_partitions(n_partitions: int, n_allowed: int, seed: int = 0):
+    """Generate the unique values of one column for each daily partition, plus a rule schema for it."""
+    rng = np.random.default_rng(seed)
+    codes = [f"CODE_{i}" for i in range(n_allowed)]
+    partitions = [np.array(rng.choice(codes, size=rng.integers(1, 10), replace=False), dtype=object)
+                  for _ in range(n_partitions)]
+    rule_dict = {"code": {"allowed": codes, "contains": codes[:1], "empty": False}}
+    return partitions, rule_dict
+
+
+def run_new_validator_per_partition(partitions, rule_dict) -> None:
+    for values in partitions:
+        validator = Validator(rule_dict)
+        validator.validate({"code": values})
+
+
+def run_pooled_validator(partitions, rule_dict) -> None:
+    validators = ValidatorPool(rule_dict)
+    for values in partitions:
+        with validators.borrow() as validator:
+            validator.validate({"code": values})
+
+
+def best_of(func, repeat: int, *args) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure per-partition overhead of Cerberus validator reuse.")
+    parser.add_argument("--partitions", type=int, default=1000, help="Number of partitions (e.g. dates) per rule")
+    parser.add_argument("--allowed", type=int, default=50, help="Number of allowed values in the rule")
+    parser.add_argument("--repeat", type=int, default=3, help="Repetitions, the best timing is reported")
+    args = parser.parse_args()
+
+    partitions, rule_dict = make_partitions(args.partitions, args.allowed)
+
+    before = best_of(run_new_validator_per_partition, args.repeat, partitions, rule_dict)
+    after = best_of(run_pooled_validator, args.repeat, partitions, rule_dict)
+
+    print(f"Partitions: {args.partitions}, allowed values: {args.allowed}")
+    print(f"New Validator per partition:   {before:8.3f} s total, {before / args.partitions * 1e6:8.1f} µs per partition")
+    print(f"Compiled validator reused:     {after:8.3f} s total, {after / args.partitions * 1e6:8.1f} µs per partition")
+    print(f"Speed-up: {before / after:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
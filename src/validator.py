@@ -5,18 +5,98 @@ Data Validator Script
 
 """
 
+from __future__ import annotations
+
 import argparse
+import ast
+import atexit
+from array import array
+import copy
 import logging
+import multiprocessing
 import sys
 import os
+import re
+import shutil
 import glob
-from typing import Dict, List, Any, Set, Optional
-import pandas as pd
-from datetime import datetime
-from cerberus import Validator
+import hashlib
+import importlib
+import importlib.util
+import io
+import json
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, List, Any, Sequence, Set, Optional, Tuple
+from collections import OrderedDict
+from contextlib import contextmanager
+from collections.abc import Container, Iterable
+from dataclasses import dataclass
+from functools import lru_cache
+from datetime import date, datetime
 import textwrap
+import threading
+import tokenize
+import time
 from pathlib import Path
 
+
+class LazyModule:
+    """
+    Stand-in for a module that is imported on first use, then takes its place in this module's globals.
+    
+    Keeps startup (the CLI prompts, or a run stopping on a bad path) free of the pandas/pyarrow/openpyxl import cost.
+    """
+    
+    def __init__(self, name: str, alias: str):
+        self._name = name
+        self._alias = alias
+    
+    def __getattr__(self, attr: str) -> Any:
+        module = importlib.import_module(self._name)
+        globals()[self._alias] = module
+        return getattr(module, attr)
+
+
+if TYPE_CHECKING:
+    # Plain imports for type checkers and PyInstaller's import analysis, which do not see the lazy ones
+    import cerberus
+    import numpy as np
+    import openpyxl
+    import pandas as pd
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.dataset as ds
+    import pyarrow.feather as feather
+    import pyarrow.parquet as pq
+    from concurrent import futures
+else:
+    cerberus = LazyModule("cerberus", "cerberus")
+    np = LazyModule("numpy", "np")
+    openpyxl = LazyModule("openpyxl", "openpyxl")
+    pd = LazyModule("pandas", "pd")
+    pa = LazyModule("pyarrow", "pa")
+    pa_csv = LazyModule("pyarrow.csv", "pa_csv")
+    ds = LazyModule("pyarrow.dataset", "ds")
+    feather = LazyModule("pyarrow.feather", "feather")
+    pq = LazyModule("pyarrow.parquet", "pq")
+    futures = LazyModule("concurrent.futures", "futures")
+
+# Error values of Excel formulas, read as missing (NaN) like pd.read_excel does (openpyxl's ERROR_CODES)
+EXCEL_ERROR_CODES = frozenset(("#NULL!", "#DIV/0!", "#VALUE!", "#REF!", "#NAME?", "#NUM!", "#N/A"))
+
+# Data file formats by file extension; anything else is read as an Excel workbook
+DATA_FILE_FORMATS = {
+    ".xlsx": "excel", ".xlsm": "excel", ".xls": "excel",
+    ".csv": "csv",
+    ".parquet": "parquet", ".pq": "parquet",
+    ".feather": "feather", ".arrow": "feather", ".ipc": "feather",
+    ".jsonl": "jsonl", ".ndjson": "jsonl",
+}
+
+# Rows per chunk when reading JSON Lines files
+JSONL_CHUNK_ROWS = 100_000
+
+# Default rows per chunk in chunked (out-of-core) validation
+CHUNK_ROWS = 1_000_000
+
 # ---------------------------------------------------------------------
 # Logging setup
 # ---------------------------------------------------------------------
@@ -70,6 +150,14 @@ def clean_path_input(user_input: str) -> str:
     
     return cleaned
 
+def check_input_files(data_file: str, rules_file: str, logger: logging.Logger) -> None:
+    """Stop on missing data/rules files before anything is loaded (and the heavy libraries are imported)."""
+    for label, file_path in (("Rules", rules_file), ("Data", data_file)):
+        if file_path != "use_cache" and not os.path.isfile(file_path):
+            logger.error(f"🐞 {label} file not found: {file_path}")
+            sys.exit(1)
+
+
 def get_project_root() -> Path:
     if getattr(sys, 'frozen', False):  
         # Running as PyInstaller EXE - use directory where EXE is located
@@ -79,326 +167,2771 @@ def get_project_root() -> Path:
         return Path(__file__).resolve().parents[1]
 
 
-def get_latest_data_cache() -> Optional[str]:
-    """Find the most recent data cache parquet file."""
-    script_dir = get_project_root()
-    cache_pattern = str(script_dir / "data/data cached *.parquet")
-    cache_files = glob.glob(cache_pattern)
+# Folder (under the project root) and file name prefix of the data cache
+DATA_CACHE_DIR = "data"
+DATA_CACHE_PREFIX = "data cached "
+
+# Cache file formats and their file extensions: compressed parquet, or uncompressed Arrow IPC (Feather V2) that is
+# memory-mapped on load, so columns are paged in by the OS and shared between processes instead of decoded
+DATA_CACHE_FORMATS = {"parquet": ".parquet", "arrow": ".arrow"}
+
+# Schema metadata key holding the fingerprint of the cached source file
+DATA_CACHE_METADATA_KEY = b"data_validator.source"
+
+# Partitioned (parquet) caches are hive-style folders with one sub-folder per month/date of a date column,
+# e.g. `cache_partition=2025-08`, and a `_common_metadata` file holding the schema
+DATA_CACHE_PARTITION_FIELD = "cache_partition"
+DATA_CACHE_COMMON_METADATA = "_common_metadata"
+
+# Index file of the data cache, recording when each cache file was last used
+DATA_CACHE_INDEX = "data cache index.json"
+
+# Disk budget of the data cache; least recently used cache files are evicted beyond it
+DATA_CACHE_BYTES = 2 * 1024 * 1024 * 1024
+
+# Per-column statistics (row count, dtype, distinct values) are kept in a JSON sidecar next to each cache file,
+# e.g. `data cached <key>.parquet.stats.json`; distinct values are only kept for columns with at most
+# DATA_CACHE_STATS_MAX_DISTINCT of them
+DATA_CACHE_STATS_SUFFIX = ".stats.json"
+DATA_CACHE_STATS_MAX_DISTINCT = 1000
+
+
+def get_data_cache_dir() -> Path:
+    """Folder holding the data cache files."""
+    return get_project_root() / DATA_CACHE_DIR
+
+
+def hash_file_content(file_path: str, block_size: int = 1024 * 1024) -> str:
+    """Hash the bytes of a file, block by block."""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def get_source_fingerprint(file_path: str, sheet_name: str, content_hash: bool = False) -> Dict[str, Any]:
+    """
+    Identify a data file and its version by resolved path, sheet, size and modification time.
+    
+    With `content_hash`, the file's bytes are hashed too, so a changed file is never mistaken for a cached one
+    even when its size and modification time were kept.
+    """
+    stat = os.stat(file_path)
+    return {
+        "path": str(Path(file_path).resolve()),
+        "sheet": sheet_name or "",
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "content_hash": hash_file_content(file_path) if content_hash else None,
+    }
+
+
+def get_data_cache_key(fingerprint: Dict[str, Any]) -> Tuple[str, str]:
+    """Cache key of a fingerprint: (source id from path and sheet, version id from size, mtime and content hash)."""
+    source = f"{os.path.normcase(fingerprint['path'])}|{fingerprint['sheet']}"
+    version = f"{fingerprint['size']}|{fingerprint['mtime_ns']}|{fingerprint['content_hash']}"
+    return (hashlib.blake2b(source.encode("utf-8"), digest_size=8).hexdigest(),
+            hashlib.blake2b(version.encode("utf-8"), digest_size=8).hexdigest())
+
+
+def get_data_cache_path(fingerprint: Dict[str, Any], cache_format: str = "parquet") -> Path:
+    """Path of the cache file of one version of a data file: `data cached <source id>-<version id>.parquet`."""
+    source_id, version_id = get_data_cache_key(fingerprint)
+    return get_data_cache_dir() / f"{DATA_CACHE_PREFIX}{source_id}-{version_id}{DATA_CACHE_FORMATS[cache_format]}"
+
+
+def get_data_cache_format(cache_file: str) -> str:
+    """Format of a cache file (or Parquet/Feather data file), from its extension."""
+    return "arrow" if get_data_file_format(cache_file) == "feather" else "parquet"
+
+
+def list_data_cache_files(cache_dir: Path, pattern: str = "*") -> Dict[str, str]:
+    """Cache files (name -> path) in a folder, in any cache format; temporary files of unfinished writes are skipped."""
+    return {Path(cache_file).name: cache_file
+            for extension in DATA_CACHE_FORMATS.values()
+            for cache_file in glob.glob(str(cache_dir / f"{DATA_CACHE_PREFIX}{pattern}{extension}"))}
+
+
+def get_data_cache_size(cache_file: str) -> int:
+    """Size in bytes of a cache file (or of all files of a partitioned cache folder) and its statistics sidecar."""
+    stats_path = get_data_cache_stats_path(cache_file)
+    stats_size = os.path.getsize(stats_path) if os.path.exists(stats_path) else 0
+    if os.path.isdir(cache_file):
+        return stats_size + sum(path.stat().st_size for path in Path(cache_file).rglob("*") if path.is_file())
+    return stats_size + os.path.getsize(cache_file)
+
+
+def remove_data_cache_file(cache_file: str) -> None:
+    """Remove a cache file, or a partitioned cache folder with everything in it, and its statistics sidecar."""
+    if os.path.isdir(cache_file):
+        shutil.rmtree(cache_file)
+    else:
+        os.remove(cache_file)
+    stats_path = get_data_cache_stats_path(cache_file)
+    if os.path.exists(stats_path):
+        os.remove(stats_path)
+
+
+def read_data_cache_schema(cache_file: str) -> pa.Schema:
+    """Read the schema of a cache file without reading its data."""
+    if os.path.isdir(cache_file):
+        return pq.read_schema(os.path.join(cache_file, DATA_CACHE_COMMON_METADATA))
+    if get_data_cache_format(cache_file) == "arrow":
+        with pa.memory_map(cache_file) as source:
+            return pa.ipc.open_file(source).schema
+    return pq.read_schema(cache_file)
+
+
+def open_data_cache_dataset(cache_file: str) -> ds.Dataset:
+    """Open a cache file or partitioned cache folder as a dataset, for reads filtered by row."""
+    if get_data_cache_format(cache_file) == "arrow":
+        return ds.dataset(cache_file, format="ipc")
+    return ds.dataset(cache_file, format="parquet", partitioning="hive" if os.path.isdir(cache_file) else None)
+
+
+def read_data_cache(cache_file: str, columns: Optional[List[Any]] = None, row_filter: Optional[ds.Expression] = None) -> pd.DataFrame:
+    """
+    Read (the given columns of) a cache file; Arrow IPC caches are memory-mapped rather than read into memory.
+    
+    With a row filter, only the partitions and parquet row groups whose statistics can match it are read.
+    """
+    if row_filter is not None or os.path.isdir(cache_file):
+        if columns is None:
+            columns = read_data_cache_schema(cache_file).names
+        return open_data_cache_dataset(cache_file).to_table(columns=columns, filter=row_filter).to_pandas()
+    if get_data_cache_format(cache_file) == "arrow":
+        table = feather.read_table(cache_file, columns=columns, memory_map=True)
+        return table.to_pandas(split_blocks=True)  # Columns are not consolidated into (copied) 2D blocks
+    return pd.read_parquet(cache_file, columns=columns)
+
+
+def iter_data_cache_batches(cache_file: str, columns: Optional[List[Any]], batch_size: int,
+                            row_filter: Optional[ds.Expression] = None) -> Iterator[pa.RecordBatch]:
+    """Stream record batches of (the given columns of) a cache file, optionally filtered by row."""
+    if row_filter is not None or os.path.isdir(cache_file):
+        if columns is None:
+            columns = read_data_cache_schema(cache_file).names
+        yield from open_data_cache_dataset(cache_file).to_batches(columns=columns, filter=row_filter, batch_size=batch_size)
+    elif get_data_cache_format(cache_file) == "arrow":
+        with pa.memory_map(cache_file) as source:
+            reader = pa.ipc.open_file(source)
+            for i in range(reader.num_record_batches):
+                batch = reader.get_batch(i)
+                yield batch.select(columns) if columns is not None else batch
+    else:
+        yield from pq.ParquetFile(cache_file).iter_batches(batch_size=batch_size, columns=columns)
+
+
+def write_partitioned_data_cache(table: pa.Table, path: Path, date_series: pd.Series, granularity: str) -> None:
+    """Write a table as a hive-partitioned parquet folder, one sub-folder per month/date of `date_series`."""
+    codes, keys = derive_partition_keys(date_series, granularity)
+    
+    # Rows with a missing date have a null key and end up in the `__HIVE_DEFAULT_PARTITION__` folder
+    missing = np.array([pd.isna(key) for key in keys], dtype=bool)
+    key_names = pa.array(["" if pd.isna(key) else str(key) for key in keys], type=pa.string())
+    indices = pa.array(codes.astype(np.int32), mask=missing[codes] if missing.any() else None)
+    partition_keys = pa.DictionaryArray.from_arrays(indices, key_names).dictionary_decode()
+    
+    ds.write_dataset(
+        table.append_column(DATA_CACHE_PARTITION_FIELD, partition_keys),
+        path,
+        format="parquet",
+        partitioning=ds.partitioning(pa.schema([(DATA_CACHE_PARTITION_FIELD, pa.string())]), flavor="hive"),
+        preserve_order=True,
+    )
+    pq.write_metadata(table.schema, path / DATA_CACHE_COMMON_METADATA)
+
+
+def read_data_cache_info(cache_file: str) -> Dict[str, Any]:
+    """Read the source fingerprint and column names stored with a cache file (empty for caches without them)."""
+    metadata = read_data_cache_schema(cache_file).metadata or {}
+    info = metadata.get(DATA_CACHE_METADATA_KEY)
+    return json.loads(info) if info else {}
+
+
+def data_cache_covers(cache_file: str, rule: Optional[pd.DataFrame]) -> bool:
+    """Check if a cache file holds every source column the rules reference (or every source column without rules)."""
+    try:
+        info = read_data_cache_info(cache_file)
+        cached_columns = set(read_data_cache_schema(cache_file).names)
+    except Exception:
+        return False  # Unreadable cache files are simply replaced
+    if "columns" not in info:
+        return False
+    
+    needed_columns = info["columns"] if rule is None else get_rule_columns(rule, info["columns"])
+    return set(map(str, needed_columns)) <= cached_columns
+
+
+def get_cache_source_file(cache_file: str, rule: Optional[pd.DataFrame], logger: logging.Logger) -> Optional[Tuple[str, str]]:
+    """
+    Find the source file (path, sheet) a `use_cache` run reads instead of the latest cache, when the cache lacks
+    columns the rules reference (caches hold the columns of the rules they were made for). None if it has them.
+    Stops the run if the source file is gone.
+    """
+    try:
+        info = read_data_cache_info(cache_file)
+        cached_columns = set(read_data_cache_schema(cache_file).names)
+    except Exception:
+        return None  # Unreadable cache files are reported when they are loaded
+    if "columns" not in info:
+        return None  # Caches without column names hold every column they were given
+    needed_columns = info["columns"] if rule is None else get_rule_columns(rule, info["columns"])
+    missing_columns = [str(column) for column in needed_columns if str(column) not in cached_columns]
+    if not missing_columns:
+        return None
+    
+    message = f"The latest cache {os.path.basename(cache_file)} does not hold the columns {', '.join(missing_columns)} referenced by the rules"
+    if not info.get("path"):
+        logger.error(f"🐞 {message}, and it was saved without a source file. Please run with the data file to cache them.")
+        sys.exit(1)
+    if not os.path.exists(info["path"]):
+        logger.error(f"🐞 {message}, and its source file {info['path']} is gone. Please run with the data file to cache them.")
+        sys.exit(1)
+    logger.info(f"\n♻️ {message}, reading its source file {info['path']} instead")
+    return info["path"], info.get("sheet", "")
+
+
+# Comparison operators of a condition scope, as (lower, upper) bound flags with the column on the left-hand side
+SCOPE_BOUND_OPS = {ast.GtE: (True, False), ast.Gt: (True, False), ast.LtE: (False, True), ast.Lt: (False, True), ast.Eq: (True, True)}
+SCOPE_FLIPPED_OPS = {ast.GtE: ast.LtE, ast.Gt: ast.Lt, ast.LtE: ast.GtE, ast.Lt: ast.Gt, ast.Eq: ast.Eq}
+
+
+def get_scope_date_bounds(scope: str) -> Dict[str, Tuple[Optional[pd.Timestamp], Optional[pd.Timestamp]]]:
+    """
+    Find the date range a condition scope restricts columns to, as {column: (lowest, highest)} (None is open).
+    
+    Only comparisons of a column with a date string, combined with and/&, or/| and chained comparisons, give bounds;
+    anything else bounds nothing. Strict comparisons are widened to inclusive ones, so the range always covers the scope.
+    """
+    # Backtick-quoted column names are not valid Python, replace them by placeholder names
+    quoted = {}
+    def to_placeholder(match: re.Match) -> str:
+        quoted[f"_scope_column_{len(quoted)}"] = match.group(1)
+        return f"_scope_column_{len(quoted) - 1}"
+    
+    # Like DataFrame.query, & and | are read as `and` / `or`, with a lower precedence than comparisons
+    try:
+        tokens = tokenize.generate_tokens(io.StringIO(re.sub(r"`([^`]*)`", to_placeholder, scope)).readline)
+        source = tokenize.untokenize((tokenize.NAME, {"&": "and", "|": "or"}[token.string]) if token.string in ("&", "|")
+                                     else (token.type, token.string) for token in tokens)
+        tree = ast.parse(source, mode="eval")
+    except (SyntaxError, tokenize.TokenError):
+        return {}
+    
+    def intersect(left, right):
+        bounds = {**left, **right}
+        for column in left.keys() & right.keys():
+            lows = [b[0] for b in (left[column], right[column]) if b[0] is not None]
+            highs = [b[1] for b in (left[column], right[column]) if b[1] is not None]
+            bounds[column] = (max(lows) if lows else None, min(highs) if highs else None)
+        return bounds
+    
+    def union(left, right):
+        bounds = {}
+        for column in left.keys() & right.keys():
+            (low_1, high_1), (low_2, high_2) = left[column], right[column]
+            bounds[column] = (None if low_1 is None or low_2 is None else min(low_1, low_2),
+                              None if high_1 is None or high_2 is None else max(high_1, high_2))
+        return bounds
+    
+    def compare(left, op, right):
+        if isinstance(left, ast.Constant) and isinstance(right, ast.Name):
+            left, op, right = right, SCOPE_FLIPPED_OPS.get(type(op), ast.NotEq)(), left
+        if not (isinstance(left, ast.Name) and isinstance(right, ast.Constant) and isinstance(right.value, str)
+                and type(op) in SCOPE_BOUND_OPS):
+            return {}
+        try:
+            value = pd.Timestamp(right.value)
+        except (ValueError, TypeError):
+            return {}
+        if pd.isna(value) or value.tzinfo is not None:
+            return {}
+        is_lower, is_upper = SCOPE_BOUND_OPS[type(op)]
+        return {quoted.get(left.id, left.id): (value if is_lower else None, value if is_upper else None)}
+    
+    def bounds_of(node):
+        if isinstance(node, ast.BoolOp):
+            combine = intersect if isinstance(node.op, ast.And) else union
+            bounds = bounds_of(node.values[0])
+            for value in node.values[1:]:
+                bounds = combine(bounds, bounds_of(value))
+            return bounds
+        if isinstance(node, ast.Compare):
+            bounds = {}
+            operands = [node.left, *node.comparators]
+            for left, op, right in zip(operands, node.ops, operands[1:]):
+                bounds = intersect(bounds, compare(left, op, right))
+            return bounds
+        return {}
+    
+    return bounds_of(tree.body)
+
+
+def get_cache_row_filter(cache_file: str, rule: Optional[pd.DataFrame]) -> Tuple[Optional[ds.Expression], str]:
+    """
+    Build a row filter reading only the cached rows some rule scope can select, with a description of it.
+    
+    Rows are only filtered when every rule has a condition scope bounding a date column, as one full-dataset or
+    "each ..." rule needs every row. On a partitioned cache, the bounds of its partition column also prune partitions.
+    """
+    if rule is None:
+        return None, ""
+    try:
+        schema = read_data_cache_schema(cache_file)
+        info = read_data_cache_info(cache_file)
+    except Exception:
+        return None, ""
+    partition_by = info.get("partition_by") if os.path.isdir(cache_file) else None
+    key_format = "%Y-%m" if info.get("partition_granularity", "month") == "month" else "%Y-%m-%d"
+    
+    row_filter, descriptions = None, []
+    for scope in dict.fromkeys(str(scope).strip() for scope in rule["scope"]):
+        if scope == "" or scope.startswith("each"):
+            return None, ""
+        
+        # Only bounds of timezone-naive timestamp columns can be compared with the cached values
+        scope_filter, scope_descriptions = None, []
+        for column, (low, high) in get_scope_date_bounds(scope).items():
+            index = schema.get_field_index(column)
+            if low is None and high is None:
+                continue
+            if index < 0 or not pa.types.is_timestamp(schema.field(index).type) or schema.field(index).type.tz is not None:
+                continue
+            field_type = schema.field(index).type
+            for bound, is_lower in ((low, True), (high, False)):
+                if bound is None:
+                    continue
+                condition = ds.field(column) >= pa.scalar(bound, type=field_type) if is_lower else ds.field(column) <= pa.scalar(bound, type=field_type)
+                if column == partition_by:
+                    key = ds.field(DATA_CACHE_PARTITION_FIELD)
+                    condition = condition & (key >= bound.strftime(key_format) if is_lower else key <= bound.strftime(key_format))
+                scope_filter = condition if scope_filter is None else scope_filter & condition
+            low, high = ("" if bound is None else str(bound.date() if bound == bound.normalize() else bound) for bound in (low, high))
+            scope_descriptions.append(f"{column} in [{low}, {high}]")
+        
+        if scope_filter is None:
+            return None, ""
+        row_filter = scope_filter if row_filter is None else row_filter | scope_filter
+        descriptions.append(" and ".join(scope_descriptions))
+    
+    return row_filter, " or ".join(dict.fromkeys(descriptions))
+
+
+def get_data_cache_stats_path(cache_file: str) -> str:
+    """Path of the statistics sidecar of a cache file."""
+    return str(cache_file) + DATA_CACHE_STATS_SUFFIX
+
+
+def encode_stats_value(value: Any) -> List[Any]:
+    """Encode a cell value as a [type, value] JSON pair, so it is decoded as the same Python type."""
+    if isinstance(value, (bool, np.bool_)):
+        return ["bool", bool(value)]
+    if isinstance(value, (int, np.integer)):
+        return ["int", int(value)]
+    if isinstance(value, (float, np.floating)):
+        return ["float", float(value)]
+    if isinstance(value, str):
+        return ["str", value]
+    if value is pd.NaT or isinstance(value, pd.Timestamp) and value.tzinfo is None:
+        return ["timestamp", None if value is pd.NaT else value.isoformat()]
+    raise TypeError(f"Values of type {type(value).__name__} are not kept in cache statistics")
+
+
+def decode_stats_value(encoded: List[Any]) -> Any:
+    """Decode a [type, value] pair written by `encode_stats_value`."""
+    kind, value = encoded
+    if kind == "timestamp":
+        return pd.NaT if value is None else pd.Timestamp(value)
+    return value
+
+
+def has_stats_dtype(series: pd.Series) -> bool:
+    """Check if distinct values of a column can be rebuilt exactly from their JSON encoding and dtype."""
+    dtype = series.dtype
+    return dtype == object or isinstance(dtype, pd.StringDtype) or (isinstance(dtype, np.dtype) and dtype.kind in "biufM")
+
+
+def compute_column_stats(series: pd.Series) -> Dict[str, Any]:
+    """Row count, dtype and (for low-cardinality columns) distinct values of one cached column, as validation sees it."""
+    # Distinct values are those of the NaN-cleaned column, in order of first appearance, as validation sees them
+    cleaned = series.fillna('') if series.hasnans else series
+    stats = {"rows": len(series), "dtype": str(cleaned.dtype)}
+    
+    try:
+        if has_stats_dtype(cleaned):
+            distinct = cleaned.unique()
+            if len(distinct) <= DATA_CACHE_STATS_MAX_DISTINCT:
+                stats["distinct"] = [encode_stats_value(value) for value in distinct]
+    except TypeError:
+        stats.pop("distinct", None)  # Columns holding values that cannot be encoded keep their counts only
+    return stats
+
+
+def get_partitioned_row_order(date_series: pd.Series, granularity: str) -> np.ndarray:
+    """Positions of the rows of a partitioned cache in the order they are read back: by partition folder name."""
+    codes, keys = derive_partition_keys(date_series, granularity)
+    # Folders are read in order of their names, rows with a missing date being in `__HIVE_DEFAULT_PARTITION__`
+    names = np.array(["__HIVE_DEFAULT_PARTITION__" if pd.isna(key) else str(key) for key in keys])
+    folder_rank = np.argsort(np.argsort(names, kind="stable"))
+    return np.argsort(folder_rank[codes], kind="stable")
+
+
+def compute_data_cache_stats(df: pd.DataFrame, table: pa.Table, by_month: Optional[str] = None,
+                             row_order: Optional[np.ndarray] = None) -> Dict[str, Any]:
+    """
+    Compute the statistics sidecar of a cache file from the frame (and Arrow table) it is written from.
+    
+    Columns are taken as later loads of the cache see them: object columns are converted back from the table (text
+    becomes `str`), and `row_order` puts the rows in the order a partitioned cache is read back in. With `by_month`,
+    distinct values are also kept per month of that date column, for "each month of" scopes.
+    """
+    def get_cached_column(i: int) -> pd.Series:
+        series = table.select([i]).to_pandas().iloc[:, 0] if df.dtypes.iloc[i] == object else df.iloc[:, i]
+        return series.iloc[row_order].reset_index(drop=True) if row_order is not None else series
+    
+    columns = [str(column) for column in df.columns]
+    stats = {"columns": {}}
+    
+    months = None
+    if by_month is not None and by_month in columns:
+        date_series = get_cached_column(columns.index(by_month))
+        if pd.api.types.is_datetime64_any_dtype(date_series):
+            codes, keys = derive_partition_keys(date_series, "month")
+            months = {"column": by_month, "months": {str(key): {} for key in keys}}
+    
+    for i, column in enumerate(columns):
+        series = get_cached_column(i)
+        column_stats = stats["columns"][column] = compute_column_stats(series)
+        if months is None or "distinct" not in column_stats:
+            continue
+        
+        # Same row selection as "each month of" validation: first appearances of each value per month
+        cleaned = series.fillna('') if series.hasnans else series
+        for key, positions in split_positions_by_partition(cleaned, codes, keys):
+            months["months"][str(key)][column] = [encode_stats_value(value) for value in cleaned.iloc[positions].unique()]
+    
+    if months is not None:
+        stats["by_month"] = months
+    return stats
+
+
+def write_data_cache_stats(cache_file: str, stats: Dict[str, Any]) -> None:
+    """Write the statistics sidecar of a cache file atomically."""
+    stats_path = get_data_cache_stats_path(cache_file)
+    temp_path = f"{stats_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump(stats, f)
+    os.replace(temp_path, stats_path)
+
+
+def read_data_cache_stats(cache_file: str) -> Dict[str, Any]:
+    """Read the statistics sidecar of a cache file (empty if it has none)."""
+    try:
+        with open(get_data_cache_stats_path(cache_file), encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+class DataCacheManager:
+    """
+    Data cache files on disk, one entry per source file, with least-recently-used eviction under a disk budget.
+    
+    Access times are kept in a small JSON index next to the cache files. Cache files missing from the index (e.g.
+    written by an older version) are picked up with their modification time as last access.
+    """
+    
+    def __init__(self, max_bytes: int = DATA_CACHE_BYTES, cache_dir: Optional[Path] = None, cache_format: str = "parquet",
+                 partition_by: Optional[str] = None, partition_granularity: str = "month", stats_by_month: Optional[str] = None):
+        self.max_bytes = max_bytes
+        self.cache_format = cache_format  # Format of new cache files; existing ones are read in any format
+        self.partition_by = partition_by  # Date column to partition new parquet caches by, if any
+        self.partition_granularity = partition_granularity
+        self.stats_by_month = stats_by_month  # Date column to also keep per-month statistics of, if any
+        self._cache_dir = cache_dir  # None = resolved on use, relative to the project root
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.RLock()
+        self._pending = []  # (writer thread, its log) of background cache writes
+    
+    @property
+    def cache_dir(self) -> Path:
+        return self._cache_dir if self._cache_dir is not None else get_data_cache_dir()
+    
+    def read_index(self) -> Dict[str, Dict[str, Any]]:
+        """Read the index entries (cache file name -> info), in sync with the cache files actually on disk."""
+        try:
+            with open(self.cache_dir / DATA_CACHE_INDEX, encoding="utf-8") as f:
+                entries = json.load(f)["entries"]
+        except (OSError, ValueError, KeyError, TypeError):
+            entries = {}
+        
+        cache_files = list_data_cache_files(self.cache_dir)
+        entries = {name: entry for name, entry in entries.items() if name in cache_files}
+        for name, cache_file in cache_files.items():
+            entry = entries.setdefault(name, {"last_access": os.path.getmtime(cache_file)})
+            entry["bytes"] = get_data_cache_size(cache_file)
+        return entries
+    
+    def write_index(self, entries: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Write the index atomically, so a crash never leaves it half-written. Each writer has its own temporary file,
+        so processes sharing the cache folder never rename (or overwrite) each other's.
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        index_path = self.cache_dir / DATA_CACHE_INDEX
+        temp_path = index_path.with_name(f"{index_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump({"entries": entries}, f, indent=1)
+            os.replace(temp_path, index_path)
+        finally:
+            if temp_path.exists():
+                temp_path.unlink()
+    
+    def touch(self, cache_file: Path, **info: Any) -> None:
+        """Record an access to a cache file (and optional info about its source) in the index."""
+        with self._lock:
+            entries = self.read_index()
+            entry = entries.setdefault(cache_file.name, {"bytes": get_data_cache_size(str(cache_file))})
+            entry.update(info, last_access=time.time())
+            self.write_index(entries)
+    
+    def latest(self) -> Optional[Path]:
+        """The most recently used cache file."""
+        entries = self.read_index()
+        if not entries:
+            return None
+        return self.cache_dir / max(entries, key=lambda name: entries[name]["last_access"])
+    
+    def use_latest(self) -> Optional[Path]:
+        """The most recently used cache file for `use_cache` runs, counted as a hit (or a miss if there is none)."""
+        self.join()  # A cache file still being written is the most recent one
+        cache_file = self.latest()
+        if cache_file is None:
+            self.misses += 1
+            return None
+        
+        self.hits += 1
+        self.touch(cache_file)
+        return cache_file
+    
+    def lookup(self, fingerprint: Dict[str, Any], rule: Optional[pd.DataFrame]) -> Optional[Path]:
+        """Find the cache file of a source file version holding the columns the rules need, counting hits and misses."""
+        self.join()
+        for cache_format in DATA_CACHE_FORMATS:
+            cache_file = self.cache_dir / get_data_cache_path(fingerprint, cache_format).name
+            if cache_file.exists() and data_cache_covers(str(cache_file), rule):
+                self.hits += 1
+                self.touch(cache_file)
+                return cache_file
+        
+        self.misses += 1
+        return None
+    
+    def store(self, df: pd.DataFrame, fingerprint: Dict[str, Any], logger: Any) -> None:
+        """
+        Save dataframe as the cache file of its source file version, then evict entries beyond the disk budget.
+        
+        The file is written under a temporary name and renamed once complete, so readers never see a partial cache.
+        Parquet caches are written as a folder partitioned by month/date when a partition column is set. A statistics
+        sidecar is written next to the cache file, from which later runs take distinct values without scanning rows.
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        cache_path = self.cache_dir / get_data_cache_path(fingerprint, self.cache_format).name
+        
+        # Remove cache files of older versions (or other formats) of the same source file; other sources keep their cache
+        source_id, _ = get_data_cache_key(fingerprint)
+        for cache_file in list_data_cache_files(self.cache_dir, f"{source_id}-*").values():
+            if Path(cache_file) == cache_path:
+                continue
+            try:
+                remove_data_cache_file(cache_file)
+                logger.info(f"\n🗑️ Removed outdated cache file: {os.path.basename(cache_file)}")
+            except Exception as e:
+                logger.error(f"\n🐞 Failed to remove outdated cache file {os.path.basename(cache_file)}: {e}")
+        
+        partition_by = self.partition_by if self.cache_format == "parquet" else None
+        if partition_by is not None and not (partition_by in df.columns and pd.api.types.is_datetime64_any_dtype(df[partition_by])):
+            logger.warning(f"⚠️ Cache partition column '{partition_by}' is not a datetime column of the data, the cache is not partitioned")
+            partition_by = None
+        
+        # The fingerprint and the source's column names are stored in the schema metadata
+        info = {**fingerprint, "columns": [str(column) for column in df.attrs.get("source_columns", df.columns)]}
+        if partition_by is not None:
+            info.update(partition_by=partition_by, partition_granularity=self.partition_granularity)
+        temp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            table = table.replace_schema_metadata({**(table.schema.metadata or {}), DATA_CACHE_METADATA_KEY: json.dumps(info)})
+            if self.cache_format == "arrow":
+                feather.write_feather(table, temp_path, compression="uncompressed")
+            elif partition_by is not None:
+                write_partitioned_data_cache(table, temp_path, df[partition_by], self.partition_granularity)
+            else:
+                pq.write_table(table, temp_path)
+            if cache_path.exists():
+                remove_data_cache_file(str(cache_path))  # Folders cannot be replaced by a rename
+            os.replace(temp_path, cache_path)
+            self.touch(cache_path, source=fingerprint["path"], sheet=fingerprint["sheet"])
+            logger.info(f"\n📦 Data cached successfully: {cache_path.name}")
+        except Exception as e:
+            logger.error(f"\n🐞 Failed to save data cache: {e}")
+            if temp_path.exists():
+                remove_data_cache_file(str(temp_path))
+            return
+        
+        # A cache without statistics is still valid, later runs then compute distinct values from its rows
+        try:
+            row_order = get_partitioned_row_order(df[partition_by], self.partition_granularity) if partition_by is not None else None
+            write_data_cache_stats(str(cache_path), compute_data_cache_stats(df, table, self.stats_by_month, row_order))
+            logger.info(f"\n📐 Column statistics cached: {os.path.basename(get_data_cache_stats_path(str(cache_path)))}")
+        except Exception as e:
+            logger.error(f"\n🐞 Failed to save column statistics of the data cache: {e}")
+        
+        self.evict(logger, keep=cache_path.name)
+    
+    def store_in_background(self, df: pd.DataFrame, fingerprint: Dict[str, Any]) -> None:
+        """Save dataframe to the cache on a background thread, e.g. while it is being validated. See `wait`."""
+        log = RuleLog()
+        thread = threading.Thread(target=self.store, args=(df, fingerprint, log), name="data-cache-writer")
+        thread.start()
+        with self._lock:
+            self._pending.append((thread, log))
+    
+    def join(self) -> None:
+        """Wait for background cache writes to finish, keeping their log for `wait`."""
+        with self._lock:
+            threads = [thread for thread, _ in self._pending]
+        for thread in threads:
+            thread.join()
+    
+    def wait(self, logger: logging.Logger) -> None:
+        """Wait for background cache writes to finish and log what they did."""
+        self.join()
+        with self._lock:
+            pending, self._pending = self._pending, []
+        for _, log in pending:
+            log.replay(logger)
+    
+    def evict(self, logger: logging.Logger, keep: Optional[str] = None) -> None:
+        """Remove least recently used cache files until the cache fits its disk budget (`keep` is never removed)."""
+        with self._lock:
+            entries = self.read_index()
+            total_bytes = sum(entry["bytes"] for entry in entries.values())
+            for name in sorted(entries, key=lambda name: entries[name]["last_access"]):
+                if total_bytes <= self.max_bytes:
+                    break
+                if name == keep:
+                    continue
+                try:
+                    remove_data_cache_file(str(self.cache_dir / name))
+                except OSError as e:
+                    logger.error(f"\n🐞 Failed to evict cache file {name}: {e}")
+                    continue
+                total_bytes -= entries.pop(name)["bytes"]
+                self.evictions += 1
+                logger.info(f"\n🗑️ Evicted least recently used cache file: {name}")
+            self.write_index(entries)
+    
+    def summary(self) -> str:
+        entries = self.read_index()
+        total_mb = sum(entry["bytes"] for entry in entries.values()) / (1024 * 1024)
+        return (f"🗃️ Data cache: {self.hits} hits, {self.misses} misses, {self.evictions} evictions "
+                f"({len(entries)} entries, {total_mb:.2f} of {self.max_bytes / (1024 * 1024):.0f} MB)")
+
+
+DATA_CACHE = DataCacheManager()
+
+# Cache writes still running when the interpreter exits are finished and logged first
+atexit.register(lambda: DATA_CACHE.wait(logging.getLogger(__name__)))
+
+
+def get_latest_data_cache() -> Optional[str]:
+    """Find the most recently used data cache file."""
+    cache_file = DATA_CACHE.latest()
+    return str(cache_file) if cache_file is not None else None
+
+
+def save_data_cache(df: pd.DataFrame, logger: logging.Logger, fingerprint: Optional[Dict[str, Any]] = None) -> None:
+    """
+    Save dataframe to the cache file of its source file version.
+    
+    Without a fingerprint (data that was not loaded from a file), it is cached as a version of an unnamed source,
+    identified by its content, and replaces the previous data cached that way; `use_cache` picks it up as usual.
+    """
+    if fingerprint is None:
+        fingerprint = {"path": "", "sheet": "", "size": len(df), "mtime_ns": 0, "content_hash": get_data_version(df)}
+    DATA_CACHE.store(df, fingerprint, logger)
+
+
+# Range of whole numbers kept in an int64 buffer; larger ones are kept as Python ints, like `pd.read_excel` does
+INT64_BOUNDS = (-2 ** 63, 2 ** 63 - 1)
+
+# Text `pd.read_excel` reads as booleans (when every value of the column is one of them)
+EXCEL_BOOL_TEXT = frozenset(("True", "TRUE", "true", "False", "FALSE", "false"))
+
+
+class ColumnBuffer:
+    """
+    Typed buffer for the cells of one column, filled row by row while streaming a worksheet.
+    
+    Numbers are kept in compact arrays, anything else in a list; the buffer widens its type (int -> float ->
+    object) as values come in and is converted with the same dtype rules as `pd.read_excel`, including its
+    conversion of text columns that only hold numbers or booleans, e.g. "001" -> 1.
+    """
+    
+    def __init__(self):
+        self.kind = None  # None (only missing so far), 'int', 'float', 'bool', 'datetime', 'str' or 'object'
+        self.values = []
+        self.n_missing = 0
+        self.missing_rows = []  # Rows of missing cells while the buffer holds ints, stored as 0 until converted
+        self.length = 0
+    
+    @staticmethod
+    def _kind_of(value: Any) -> str:
+        if isinstance(value, bool):
+            return "bool"
+        if isinstance(value, int):
+            return "int" if INT64_BOUNDS[0] <= value <= INT64_BOUNDS[1] else "object"
+        if isinstance(value, float):
+            return "float"
+        if isinstance(value, datetime):
+            return "datetime"
+        if isinstance(value, str):
+            return "str"
+        return "object"
+    
+    def append(self, value: Any) -> None:
+        # Empty cells are missing (na_values=[""]), numbers that are whole are read as int like pandas does
+        if value is None or value == "":
+            self._append_missing()
+            return
+        if isinstance(value, float) and value.is_integer():
+            value = int(value)
+        
+        kind = self._kind_of(value)
+        if kind != self.kind:
+            self._widen(kind)
+        self.values.append(value)
+        self.length += 1
+    
+    def _append_missing(self) -> None:
+        # Ints stay ints until the end: a later text value makes the column object with its ints kept, as in pandas
+        if self.kind == "int":
+            self.missing_rows.append(self.length)
+            self.values.append(0)
+        else:
+            self.values.append(float("nan") if self.kind == "float" else None)
+        self.n_missing += 1
+        self.length += 1
+    
+    def _widen(self, kind: str) -> None:
+        if self.kind is None:
+            # Only missing cells so far, the buffer takes the type of its first value
+            self.kind = kind
+            if self.kind == "int":
+                self.values = array("q", [0] * self.length)
+                self.missing_rows = list(range(self.length))
+            elif self.kind == "float":
+                self.values = array("d", [float("nan")] * self.length)
+            else:
+                self.values = [None] * self.length
+        elif {self.kind, kind} <= {"int", "float"}:
+            if self.kind == "int":
+                self.values = self._int_values_as_float()
+                self.missing_rows = []
+                self.kind = "float"
+        else:
+            # Mixed types are kept as Python objects, missing cells as None
+            if self.kind == "int":
+                self.values = list(self.values)
+                for row in self.missing_rows:
+                    self.values[row] = None
+                self.missing_rows = []
+            elif isinstance(self.values, array):
+                # Whole floats were ints before the buffer widened to float (see `append`)
+                self.values = [None if v != v else int(v) if v.is_integer() else v for v in self.values]
+            self.kind = "object"
+    
+    def _int_values_as_float(self) -> array:
+        values = array("d", self.values)
+        for row in self.missing_rows:
+            values[row] = float("nan")
+        return values
+    
+    def to_series(self, name: Any) -> pd.Series:
+        """Convert the buffer with the dtype `pd.read_excel` would infer for the same cells."""
+        if self.kind is None:
+            return pd.Series(np.full(self.length, np.nan), name=name)
+        if self.kind == "int" and self.missing_rows:
+            return pd.Series(np.frombuffer(self._int_values_as_float(), dtype=np.float64).copy(), name=name)
+        if self.kind in ("int", "float"):
+            return pd.Series(np.frombuffer(self.values, dtype=np.int64 if self.kind == "int" else np.float64).copy(), name=name)
+        if self.kind == "bool" and self.n_missing:
+            return pd.Series([np.nan if v is None else float(v) for v in self.values], dtype=np.float64, name=name)
+        if self.kind == "bool":
+            return pd.Series(self.values, dtype=bool, name=name)
+        if self.kind == "datetime":
+            return pd.Series(pd.to_datetime(self.values), name=name)
+        
+        if self._may_convert_text():
+            # Parse the cells with the parser `pd.read_excel` uses, so they are converted (or not) the same way
+            parser = pd.io.parsers.TextParser([[name], *(["" if v is None else v] for v in self.values)], header=0,
+                                              keep_default_na=False, na_values=[""], skip_blank_lines=False)
+            return parser.read()[name]
+        
+        values = [np.nan if v is None else v for v in self.values] if self.n_missing else self.values
+        return pd.Series(values, dtype=object if self.kind == "object" else None, name=name)
+    
+    def _may_convert_text(self) -> bool:
+        """Check if `pd.read_excel` could convert this text / mixed column, e.g. to numbers or booleans."""
+        if self.kind == "object":
+            return True  # Mixed values are also unified by its parser, e.g. 1 after True is read as True
+        # It converts all values of a text column or none, so one text value that is neither decides it
+        text = next((v for v in self.values if isinstance(v, str)), None)
+        if text is None:
+            return False
+        if text in EXCEL_BOOL_TEXT:
+            return True
+        try:
+            float(text)
+            return True
+        except ValueError:
+            return False
+
+
+def name_excel_columns(header: Iterable[Any]) -> List[Any]:
+    """Name columns from the cells of a header row the way `pd.read_excel` names them."""
+    header = list(header)
+    while header and header[-1] in (None, ""):
+        header.pop()
+    
+    names = []
+    seen = {}
+    for i, name in enumerate(header):
+        if name in (None, ""):
+            name = f"Unnamed: {i}"
+        # Mangle duplicated names as 'a', 'a.1', 'a.2', ...
+        if name in seen:
+            seen[name] += 1
+            name = f"{name}.{seen[name]}"
+        else:
+            seen[name] = 0
+        names.append(name)
+    return names
+
+
+def read_excel_rows(rows: Iterator[Sequence[Any]], rule: Optional[pd.DataFrame], logger: logging.Logger,
+                    convert: Optional[Callable[[Any], Any]] = None) -> pd.DataFrame:
+    """
+    Read the rows of a worksheet (header first) into typed column buffers, keeping only the columns referenced by
+    the rules. Memory grows with the projected columns only; `convert` maps cell values before they are buffered.
+    """
+    names = name_excel_columns(next(rows, ()))
+    columns = project_columns(rule, names, logger)
+    if columns is None:
+        columns = names
+    indices = [names.index(column) for column in columns]
+    
+    buffers = [ColumnBuffer() for _ in columns]
+    n_rows = 0
+    n_rows_with_data = 0
+    for row in rows:
+        n_rows += 1
+        # Blank rows are kept unless they are at the end of the sheet (same as pd.read_excel)
+        if any(value not in (None, "") for value in row):
+            n_rows_with_data = n_rows
+        for buffer, i in zip(buffers, indices):
+            value = row[i] if i < len(row) else None
+            if convert is not None:
+                value = convert(value)
+            buffer.append(None if value in EXCEL_ERROR_CODES else value)
+    
+    df = pd.DataFrame({column: buffer.to_series(column) for column, buffer in zip(columns, buffers)})
+    df = df.iloc[:n_rows_with_data].reset_index(drop=True)
+    df.attrs["source_columns"] = names
+    return df
+
+
+def read_excel_streaming(file_path: str, sheet_name: str, rule: Optional[pd.DataFrame], logger: logging.Logger) -> pd.DataFrame:
+    """Stream a worksheet in openpyxl read-only mode, keeping only the columns referenced by the rules."""
+    workbook = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        worksheet = workbook[sheet_name]
+        worksheet.reset_dimensions()  # Some writers store wrong sheet dimensions
+        return read_excel_rows(worksheet.iter_rows(values_only=True), rule, logger)
+    finally:
+        workbook.close()
+
+
+def convert_calamine_value(value: Any) -> Any:
+    """Map a calamine cell value to the value openpyxl gives for the same cell (dates are read as datetimes)."""
+    if type(value) is date:
+        return datetime(value.year, value.month, value.day)
+    return value
+
+
+def read_excel_calamine(file_path: str, sheet_name: str, rule: Optional[pd.DataFrame], logger: logging.Logger) -> pd.DataFrame:
+    """
+    Read a worksheet with the Rust-based calamine parser (python-calamine), keeping only the columns referenced by
+    the rules. Calamine reads formula errors as empty cells, so trailing rows of only errors are dropped.
+    """
+    from python_calamine import CalamineWorkbook  # Optional dependency, see EXCEL_ENGINES
+    
+    workbook = CalamineWorkbook.from_path(file_path)
+    try:
+        sheet = workbook.get_sheet_by_name(sheet_name)
+        
+        # Calamine starts at the first non-empty cell, pad the rows so the header is the sheet's first row
+        start_row, start_col = sheet.start or (0, 0)
+        def iter_rows() -> Iterator[List[Any]]:
+            for _ in range(start_row):
+                yield []
+            for row in sheet.iter_rows():
+                yield [""] * start_col + row if start_col else row
+        
+        return read_excel_rows(iter_rows(), rule, logger, convert_calamine_value)
+    finally:
+        workbook.close()
+
+
+def read_excel_pandas(file_path: str, sheet_name: str, rule: Optional[pd.DataFrame], logger: logging.Logger) -> pd.DataFrame:
+    """Read a whole worksheet with `pd.read_excel`, then keep only the columns referenced by the rules."""
+    df = pd.read_excel(file_path, sheet_name=sheet_name, keep_default_na=False, na_values=[""])
+    names = list(df.columns)
+    columns = project_columns(rule, names, logger)
+    if columns is not None:
+        df = df[columns]
+    df.attrs["source_columns"] = names
+    return df
+
+
+# Excel reader backends of the data file, by engine name ("auto" picks one, see resolve_excel_engine)
+EXCEL_READERS = {
+    "calamine": read_excel_calamine,
+    "openpyxl": read_excel_streaming,
+    "pandas": read_excel_pandas,
+}
+EXCEL_ENGINES = ("auto", *EXCEL_READERS)
+
+
+def resolve_excel_engine(excel_engine: str, rule: Optional[pd.DataFrame] = None) -> str:
+    """
+    Resolve the "auto" Excel engine to the fastest one installed. Without calamine, openpyxl streaming only pays
+    off by skipping the columns the rules do not reference, so sheets read without rules are read by pandas.
+    """
+    if excel_engine != "auto":
+        return excel_engine
+    if importlib.util.find_spec("python_calamine") is not None:
+        return "calamine"
+    return "openpyxl" if rule is not None else "pandas"
+
+
+def get_data_file_format(file_path: str) -> str:
+    """Detect the format of a data file from its extension."""
+    return DATA_FILE_FORMATS.get(Path(file_path).suffix.lower(), "excel")
+
+
+def project_columns(rule: Optional[pd.DataFrame], names: List[Any], logger: logging.Logger,
+                    source: str = "data file") -> Optional[List[Any]]:
+    """Select the columns referenced by the rules out of `names` (None = all columns, if there are no rules)."""
+    if rule is None:
+        return None
+    
+    columns = get_rule_columns(rule, names)
+    label = "cached columns" if source == "cache" else "columns"
+    logger.info(f"🔎 Reading {len(columns)} of {len(names)} {label} referenced by the rules: {', '.join(map(str, columns))}")
+    missing_columns = get_rule_column_names(rule) - set(map(str, names))
+    if missing_columns:
+        logger.warning(f"⚠️ Columns referenced by the rules are not in the {source}: {', '.join(sorted(missing_columns))}")
+    return columns
+
+
+def get_csv_convert_options(columns: Optional[List[Any]], names: List[Any], logger: logging.Logger) -> pa_csv.ConvertOptions:
+    """
+    Options to parse the projected columns of a CSV file (None = all columns), empty fields being missing.
+    
+    pyarrow parses every column when given none to include, so when the rules reference none of the file's
+    columns, only its first column is parsed (to count the rows); callers drop it with `table.select(columns)`.
+    """
+    include_columns = names if columns is None else columns
+    if not include_columns and names:
+        logger.info("🔎 None of the columns referenced by the rules are in the data file, only its rows are counted")
+        include_columns = names[:1]
+    return pa_csv.ConvertOptions(include_columns=include_columns, null_values=[""], strings_can_be_null=True)
+
+
+def read_csv_projected(file_path: str, rule: Optional[pd.DataFrame], logger: logging.Logger) -> pd.DataFrame:
+    """
+    Read a CSV file with the multithreaded pyarrow reader, keeping only the columns referenced by the rules.
+    
+    Empty fields are read as missing (other markers such as `NA` or `NULL` stay text). Column types are inferred
+    by pyarrow from the values: int64, float64, bool (`true`/`True`/`TRUE` and their false), date and timestamp columns
+    (ISO format, parsed to datetime64 so "each month/date" scopes work on CSV data too), and text for any
+    other column. Unlike the Excel path, codes such as `001` in a column of numbers are read as integers.
+    """
+    with pa_csv.open_csv(file_path) as reader:  # Only parses the first block to get the header
+        names = reader.schema.names
+    columns = project_columns(rule, names, logger)
+    
+    table = pa_csv.read_csv(
+        file_path,
+        read_options=pa_csv.ReadOptions(use_threads=True),
+        convert_options=get_csv_convert_options(columns, names, logger),
+    )
+    if columns is not None:
+        table = table.select(columns)
+    df = table.to_pandas(date_as_object=False)
+    df.attrs["source_columns"] = names
+    return df
+
+
+def read_parquet_projected(file_path: str, rule: Optional[pd.DataFrame], logger: logging.Logger) -> pd.DataFrame:
+    """Read a Parquet file, deserializing only the columns referenced by the rules."""
+    names = pq.read_schema(file_path).names
+    columns = project_columns(rule, names, logger)
+    df = pd.read_parquet(file_path, columns=columns)
+    df.attrs["source_columns"] = names
+    return df
+
+
+def read_feather_projected(file_path: str, rule: Optional[pd.DataFrame], logger: logging.Logger) -> pd.DataFrame:
+    """Read a Feather / Arrow IPC file (memory-mapped), converting only the columns referenced by the rules."""
+    with pa.memory_map(file_path) as source:
+        names = pa.ipc.open_file(source).schema.names
+    columns = project_columns(rule, names, logger)
+    df = feather.read_table(file_path, columns=columns, memory_map=True).to_pandas(date_as_object=False)
+    df.attrs["source_columns"] = names
+    return df
+
+
+def read_jsonl_projected(file_path: str, rule: Optional[pd.DataFrame], logger: logging.Logger) -> pd.DataFrame:
+    """
+    Read a JSON Lines file in chunks, keeping only the columns referenced by the rules from each chunk.
+    
+    Records may have different keys; columns are projected per chunk and missing keys end up as NaN.
+    Values keep their JSON types (so codes like "001" stay strings), and dtypes are inferred once over all chunks,
+    so they do not depend on where the chunks split. Date columns of "each month/date" scopes, and the date-like
+    names pd.read_json parses by default, are parsed as dates if all their values are dates.
+    """
+    date_columns = None
+    if rule is not None:
+        date_columns = [str(scope).split(":", 1)[-1].strip() for scope in rule["scope"] if str(scope).strip().startswith("each")]
+    
+    chunks = []
+    names = {}  # Keys of all records, in order of first appearance
+    with pd.read_json(file_path, lines=True, chunksize=JSONL_CHUNK_ROWS, dtype=False, convert_dates=False) as reader:
+        for i, chunk in enumerate(reader):
+            if i == 0:
+                project_columns(rule, list(chunk.columns), logger)  # Logs the projection of the first chunk
+            names.update(dict.fromkeys(chunk.columns))
+            if rule is not None:
+                chunk = chunk[get_rule_columns(rule, list(chunk.columns))]
+            chunks.append(chunk)
+    
+    df = pd.concat(chunks, ignore_index=True).infer_objects() if chunks else pd.DataFrame()
+    for column in df.columns:
+        if column in (date_columns or []) or (date_columns is None and is_json_date_name(column)):
+            if df[column].dtype == object or pd.api.types.is_string_dtype(df[column]):
+                try:
+                    df[column] = pd.to_datetime(df[column])
+                except (ValueError, TypeError):
+                    pass  # Not all dates, kept as they are (like pd.read_json does)
+    df.attrs["source_columns"] = list(names)
+    return df
+
+
+def is_json_date_name(column: Any) -> bool:
+    """Whether pd.read_json parses a column as dates by default (see its `keep_default_dates`)."""
+    name = str(column).lower()
+    return name.endswith(("_at", "_time")) or name.startswith("timestamp") or name in ("modified", "date", "datetime")
+
+
+# Readers of the non-Excel data file formats, all taking (file_path, rule, logger)
+DATA_FILE_READERS: Dict[str, Callable[[str, Optional[pd.DataFrame], logging.Logger], pd.DataFrame]] = {
+    "csv": read_csv_projected,
+    "parquet": read_parquet_projected,
+    "feather": read_feather_projected,
+    "jsonl": read_jsonl_projected,
+}
+
+
+def log_cache_row_filter(cache_file: str, row_filter: Optional[ds.Expression], description: str, logger: logging.Logger) -> None:
+    """Log which rows (and partitions) of a cache file are read."""
+    if row_filter is None:
+        return
+    message = f"\n🔎 Reading only cached rows where {description}"
+    if os.path.isdir(cache_file):
+        dataset = open_data_cache_dataset(cache_file)
+        n_read = sum(1 for _ in dataset.get_fragments(filter=row_filter))
+        message += f" ({n_read} of {len(dataset.files)} partitions)"
+    logger.info(message)
+
+
+@dataclass(frozen=True)
+class DataOrigin:
+    """
+    Version of the source data was loaded from, handed by its loader to `validate_data` with the data.
+    
+    It only describes the data exactly as loaded; frames filtered, reordered or edited since then are validated
+    without it (their version is then hashed from their content).
+    """
+    version: str  # Source file version (its cache key), plus the row order or filter it was loaded with
+    n_rows: int
+    stats_cache_file: Optional[str] = None  # Cache file whose column statistics hold for every loaded row
+    
+    def matches(self, data: pd.DataFrame) -> bool:
+        """Check if data still has the loaded rows, in their loaded order (cheap, it does not look at values)."""
+        return len(data) == self.n_rows and data.index.equals(pd.RangeIndex(self.n_rows))
+
+
+def load_data_cache(cache_file: str, logger: logging.Logger, rule: Optional[pd.DataFrame] = None) -> Tuple[pd.DataFrame, DataOrigin]:
+    """
+    Load data (and its origin) from a cache file. If rules are given, only the columns they reference are read,
+    and only the rows their scopes can select when every scope bounds a date column.
+    """
+    try:
+        file_size = get_data_cache_size(cache_file) / (1024 * 1024)  # Convert to MB
+        logger.info(f"\n📊 Loading data from cache: {os.path.basename(cache_file)}, Size: {file_size:.2f} MB")
+        
+        # Only deserialize the columns referenced by the rules, and the rows (partitions) their scopes select
+        columns = project_columns(rule, read_data_cache_schema(cache_file).names, logger, source="cache")
+        row_filter, filter_description = get_cache_row_filter(cache_file, rule)
+        log_cache_row_filter(cache_file, row_filter, filter_description, logger)
+        df = read_data_cache(cache_file, columns, row_filter)
+        
+        # The cache key identifies the source file version, so scope masks memoized for it stay valid
+        version = Path(cache_file).stem[len(DATA_CACHE_PREFIX):]
+        if os.path.isdir(cache_file):
+            version += " in partition order"  # Rows are not in the order of the source file
+        if row_filter is not None:
+            version += f" where {filter_description}"
+        # Its statistics hold for every row of the cache, so only for data read without a row filter
+        stats_cache_file = cache_file if row_filter is None and os.path.exists(get_data_cache_stats_path(cache_file)) else None
+        df.attrs.pop("source_columns", None)
+        logger.info(textwrap.dedent(f"""
+            📊 Data Load Summary (from Cache)
+            - File: {os.path.basename(cache_file)}
+            - Shape: {df.shape}
+            - Columns: {', '.join([f'{col} ({df[col].dtype})' for col in df.columns])}"""))
+        
+        return df, DataOrigin(version, len(df), stats_cache_file)
+    
+    except Exception as e:
+        logger.error(f"🐞 Failed to load cache file {cache_file}: {e}")
+        sys.exit(1)
+
+
+def load_data(file_path: str, sheet_name: str, logger: logging.Logger, rule: Optional[pd.DataFrame] = None,
+              cache_content_hash: bool = False, excel_engine: str = "auto") -> pd.DataFrame:
+    """
+    Load data from a data file or cache. If rules are given, only the columns they reference are read.
+    
+    Supported data files: Excel workbooks, CSV, Parquet, Feather / Arrow IPC and JSON Lines (see DATA_FILE_FORMATS).
+    Excel workbooks are read with `excel_engine` (see EXCEL_ENGINES). A data file that is unchanged since it was
+    last cached (same path, sheet, size, modification time and, with `cache_content_hash`, content) is loaded
+    from its cache instead.
+    """
+    return load_data_with_origin(file_path, sheet_name, logger, rule, cache_content_hash, excel_engine)[0]
+
+
+def load_data_with_origin(file_path: str, sheet_name: str, logger: logging.Logger, rule: Optional[pd.DataFrame] = None,
+                          cache_content_hash: bool = False, excel_engine: str = "auto") -> Tuple[pd.DataFrame, DataOrigin]:
+    """Load data like `load_data`, with the origin to give `validate_data` along with the (unchanged) data."""
+    # Option 1: Load from the most recent cache parquet file
+    if file_path == "use_cache":
+        cache_file = DATA_CACHE.use_latest()
+        
+        # Error handling: no cache file found
+        if cache_file is None:
+            logger.error("🐞 No cache file found. Please run with actual data file first to create cache.")
+            sys.exit(1)
+        
+        source = get_cache_source_file(str(cache_file), rule, logger)
+        if source is not None:
+            return load_data_with_origin(*source, logger, rule, cache_content_hash, excel_engine)
+        return load_data_cache(str(cache_file), logger, rule)
+    
+    # Option 2: Load from the data file, or from its cache if the file has not changed since
+    else:
+        file_format = get_data_file_format(file_path)
+        try:
+            fingerprint = get_source_fingerprint(file_path, sheet_name if file_format == "excel" else "", cache_content_hash)
+            cache_file = DATA_CACHE.lookup(fingerprint, rule)
+            if cache_file is not None:
+                logger.info(f"\n♻️ {file_path} is unchanged since it was cached, loading it from the cache")
+                return load_data_cache(str(cache_file), logger, rule)
+            
+            file_size = fingerprint["size"] / (1024 * 1024)  # Convert to MB
+            if file_format == "excel":
+                excel_engine = resolve_excel_engine(excel_engine, rule)
+                logger.info(f"\n📊 Loading data from Excel: {file_path}, Sheet: {sheet_name}, Size: {file_size:.2f} MB, Engine: {excel_engine}")
+                df = EXCEL_READERS[excel_engine](file_path, sheet_name, rule, logger)
+            else:
+                logger.info(f"\n📊 Loading data from {file_format.upper()}: {file_path}, Size: {file_size:.2f} MB")
+                df = DATA_FILE_READERS[file_format](file_path, rule, logger)
+            logger.info(textwrap.dedent(f"""
+                📊 Data Load Summary (from Original File)
+                - File: {file_path}
+                - {f'Sheet: {sheet_name}' if file_format == 'excel' else f'Format: {file_format}'}
+                - Shape: {df.shape}
+                - Columns: {', '.join([f'{col} ({df[col].dtype})' for col in df.columns])}"""))
+            # Save to parquet cache, keyed by the data file's fingerprint, while the data is validated
+            DATA_CACHE.store_in_background(df, fingerprint)
+            
+            return df, DataOrigin("-".join(get_data_cache_key(fingerprint)), len(df))
+        
+        except Exception as e:
+            logger.error(f"🐞 Failed to load data from {file_path}: {e}")
+            sys.exit(1)
+
+
+def iter_data_chunks(file_path: str, logger: logging.Logger, rule: Optional[pd.DataFrame] = None,
+                     chunk_rows: int = CHUNK_ROWS) -> Iterator[pd.DataFrame]:
+    """
+    Stream data in chunks of `chunk_rows` rows from the cache or a Parquet/Feather/CSV file, for chunked validation.
+    
+    Only one chunk is held in memory at a time; rows keep their position in the file as index.
+    """
+    if file_path == "use_cache":
+        source, label = DATA_CACHE.use_latest(), "cache"
+        if source is None:
+            logger.error("🐞 No cache file found. Please run with actual data file first to create cache.")
+            sys.exit(1)
+        source = str(source)
+        source_file = get_cache_source_file(source, rule, logger)
+        if source_file is not None:
+            yield from iter_data_chunks(source_file[0], logger, rule, chunk_rows)
+            return
+    else:
+        source, label = file_path, "data file"
+        if get_data_file_format(file_path) not in ("parquet", "feather", "csv"):
+            logger.error(f"🐞 Chunked validation reads the cache, Parquet, Feather or CSV files, not {get_data_file_format(file_path)} files. Please run once without chunks to cache the data.")
+            sys.exit(1)
+    
+    try:
+        file_size = get_data_cache_size(source) / (1024 * 1024)  # Convert to MB
+        logger.info(f"\n📊 Streaming data from {label}: {os.path.basename(source)}, Size: {file_size:.2f} MB, Chunk size: {chunk_rows} rows")
+        if label == "cache" or get_data_file_format(source) != "csv":
+            # Cache files and Parquet/Feather data files are read the same way, only the cache is filtered by row
+            columns = project_columns(rule, read_data_cache_schema(source).names, logger, source=label)
+            row_filter, filter_description = get_cache_row_filter(source, rule) if label == "cache" else (None, "")
+            log_cache_row_filter(source, row_filter, filter_description, logger)
+            batches = iter_data_cache_batches(source, columns, chunk_rows, row_filter)
+        else:
+            # Column types are inferred from the first block of the file and kept for the rest of it
+            with pa_csv.open_csv(source) as reader:
+                names = reader.schema.names
+            columns = project_columns(rule, names, logger)
+            batches = pa_csv.open_csv(
+                source,
+                read_options=pa_csv.ReadOptions(use_threads=True),
+                convert_options=get_csv_convert_options(columns, names, logger),
+            )
+    except Exception as e:
+        logger.error(f"🐞 Failed to load data from {source}: {e}")
+        sys.exit(1)
+    
+    # Batches are sliced and regrouped into chunks of chunk_rows, so CSV blocks of any size give the same chunks
+    def to_chunk(pending: List[pa.RecordBatch], offset: int) -> pd.DataFrame:
+        table = pa.Table.from_batches(pending)
+        if columns is not None:
+            table = table.select(columns)  # Drops the column a CSV file is only counted by, see get_csv_convert_options
+        chunk = table.to_pandas(date_as_object=False)
+        chunk.index = pd.RangeIndex(offset, offset + len(chunk))
+        return chunk
+    
+    pending = []
+    n_pending = 0
+    offset = 0
+    try:
+        for batch in batches:
+            while batch.num_rows:
+                head = batch.slice(0, chunk_rows - n_pending)
+                batch = batch.slice(head.num_rows)
+                pending.append(head)
+                n_pending += head.num_rows
+                if n_pending == chunk_rows:
+                    yield to_chunk(pending, offset)
+                    offset += n_pending
+                    pending, n_pending = [], 0
+        if pending:
+            yield to_chunk(pending, offset)
+    except Exception as e:
+        logger.error(f"🐞 Failed to read data from {source} after {offset} rows: {e}")
+        sys.exit(1)
+
+
+def load_rules(file_path: str, sheet_name: str, logger: logging.Logger, excel_engine: str = "auto") -> pd.DataFrame:
+    """
+    Load validation rules from Excel file, parsed by calamine when it is the (resolved) Excel engine.
+    
+    The rules are compiled once and kept next to the rules file, so an unchanged rules file (same size,
+    modification time and content hash) is loaded from its compiled rule plan without reading the workbook.
+    """
+    try:
+        logger.info(f"\n🚦 Loading rules from Excel: {file_path}, Sheet: {sheet_name}")
+        fingerprint = get_source_fingerprint(file_path, sheet_name, content_hash=True)
+        df = load_rule_plan(file_path, fingerprint)
+        if df is not None:
+            logger.info(f"♻️ {file_path} is unchanged since its rules were compiled, loading the compiled rule plan")
+        else:
+            engine = "calamine" if resolve_excel_engine(excel_engine) == "calamine" else None
+            df = pd.read_excel(file_path, sheet_name=sheet_name, keep_default_na=False, engine=engine) # Empty cells will be parsed as '' instead of NaN
+            save_rule_plan(df, file_path, fingerprint, logger)
+        logger.info(textwrap.dedent(f"""
+            🚦 Rule Load Summary
+            - File: {file_path}
+            - Sheet: {sheet_name}
+            - Shape: {df.shape}
+            - Columns: {', '.join([f'{col} ({df[col].dtype})' for col in df.columns])}"""))
+        
+        return df
+    
+    except Exception as e:
+        logger.error(f"🐞 Failed to load rules from {file_path}: {e}")
+        sys.exit(1)
+
+
+# ---------------------------------------------------------------------
+# Preprocessing Data
+# ---------------------------------------------------------------------
+
+def preprocess_data(data: pd.DataFrame, logger: logging.Logger,
+                    origin: Optional[DataOrigin] = None) -> Tuple[pd.DataFrame, Optional[DataOrigin]]:
+    """
+    preprocess data before validation.
+    
+    Returns the processed data and the origin it was loaded with, or None if preprocessing changed any values:
+    the origin identifies the data as loaded (see `DataOrigin`), so changed data is validated without it.
+    """
+    data_processed = data.copy()
+    changed = False
+
+    # # Convert NaN values in non-numeric or datetime columns to empty strings
+    # for column in data_processed.columns:
+    #     if not pd.api.types.is_numeric_dtype(data_processed[column]) or pd.api.types.is_datetime64_any_dtype(data_processed[column]):
+    #         data_processed[column] = data_processed[column].fillna('')
+    #         changed = True
+    #         logger.debug(f"Converted NaN values to empty strings in non-numeric column '{column}'")
+
+    logger.info("\n🏗️ Data preprocessing completed: (placeholder, currently nothing is changed)")
+    return data_processed, None if changed else origin
+
+
+def get_rule_column_names(rule: pd.DataFrame) -> Set[str]:
+    """Column names the rules refer to explicitly: rule columns and date columns of "each ..." scopes."""
+    names = set()
+    for column, scope in zip(rule["column"], rule["scope"]):
+        names.add(str(column).strip())
+        scope = str(scope).strip()
+        
+        # "each month/date of: <date_column>" scopes reference their date column
+        if scope.startswith("each"):
+            names.add(scope.split(":", 1)[-1].strip())
+    
+    return names
+
+
+def get_rule_columns(rule: pd.DataFrame, columns: List[Any]) -> List[Any]:
+    """Find the data columns referenced by the rules (rule columns, date columns and condition scopes)."""
+    referenced = get_rule_column_names(rule)
+    
+    # Condition scopes reference every column whose name appears in the query string
+    for scope in rule["scope"]:
+        scope = str(scope).strip()
+        if scope and not scope.startswith("each"):
+            referenced.update(col for col in columns if str(col) in scope)
+    
+    return [col for col in columns if col in referenced]
+
+
+def build_cleaned_data(data: pd.DataFrame, columns: List[Any], logger: logging.Logger) -> pd.DataFrame:
+    """Build the NaN-cleaned view of the referenced columns, shared by all rules in one run."""
+    # Only columns that actually contain NaN are filled (and therefore copied); the rest are reused as they are
+    cleaned = {}
+    filled = []
+    for column in columns:
+        series = data[column]
+        if series.hasnans:
+            cleaned[column] = series.fillna('')
+            filled.append(column)
+        else:
+            cleaned[column] = series
+    
+    data_cleaned = pd.DataFrame(cleaned, index=data.index, copy=False)
+    logger.debug(f"Built cleaned data view with {len(columns)} referenced columns, NaN filled in: {filled}")
+    return data_cleaned
+
+
+# ---------------------------------------------------------------------
+# Parsing conditions and validation
+# ---------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class DateRange:
+    """
+    Every day from start to end (inclusive), as parsed from "all dates in range: A - B".
+    
+    Behaves like the list of its daily Timestamps (membership, iteration, length), but membership is checked
+    arithmetically, and whole arrays are checked with vectorized comparisons, whatever the width of the range.
+    """
+    start: pd.Timestamp
+    end: pd.Timestamp
+    
+    def __len__(self) -> int:
+        return max((self.end - self.start) // pd.Timedelta(days=1) + 1, 0)
+    
+    def __iter__(self) -> Iterator[pd.Timestamp]:
+        # Only needed where every date must be listed, e.g. the missing members of a failed 'contains' check
+        return iter(pd.date_range(start=self.start, end=self.end, freq='D'))
+    
+    def __contains__(self, value: Any) -> bool:
+        return bool(self.isin([value])[0])
+    
+    def isin(self, values: Any) -> np.ndarray:
+        """Check which values equal one of the range's dates (only datetime values can, as in a list of Timestamps)."""
+        if isinstance(values, (np.ndarray, pd.api.extensions.ExtensionArray)) and values.dtype.kind == "M":
+            is_date = np.ones(len(values), dtype=bool)
+            dates = pd.DatetimeIndex(values)
+        else:
+            values = _to_object_array(values)
+            # Timestamps never equal their naive/timezone-aware counterparts, nor `date` objects and strings
+            is_date = np.fromiter((isinstance(value, (datetime, np.datetime64))
+                                   and (getattr(value, "tzinfo", None) is None) == (self.start.tzinfo is None)
+                                   for value in values), dtype=bool, count=len(values))
+            dates = pd.DatetimeIndex(pd.to_datetime(values[is_date], utc=self.start.tzinfo is not None))
+        
+        is_member = np.zeros(len(values), dtype=bool)
+        if (dates.tz is None) == (self.start.tzinfo is None):
+            is_member[is_date] = ((dates >= self.start) & (dates <= self.end)
+                                  & ((dates - self.start) % pd.Timedelta(days=1) == pd.Timedelta(0)))
+        return is_member
+    
+    def is_covered_by(self, values: Any) -> bool:
+        """Check if every date of the range is among the values."""
+        is_member = self.isin(values)
+        if isinstance(values, (np.ndarray, pd.api.extensions.ExtensionArray)) and values.dtype.kind == "M":
+            members = pd.DatetimeIndex(values[is_member])
+        else:
+            members = pd.DatetimeIndex(pd.to_datetime(_to_object_array(values)[is_member], utc=self.start.tzinfo is not None))
+        return members.nunique() == len(self)
+
+
+# Number of distinct rule cells whose parsed values are kept, so value lists repeated across rules are parsed once
+RULE_VALUE_CACHE_SIZE = 4096
+
+# Date constructors rule values may call, with literal arguments only, e.g. `[pd.Timestamp('2025-08-01')]`
+RULE_VALUE_DATE_CALLS = {
+    "pd.Timestamp": lambda *args, **kwargs: pd.Timestamp(*args, **kwargs),
+    "pd.to_datetime": lambda *args, **kwargs: pd.to_datetime(*args, **kwargs),
+    "datetime": datetime,
+    "date": date,
+}
+
+
+def _literal_node_value(node: ast.AST) -> Any:
+    """Evaluate one node of a rule value: constants, lists, tuples, sets, signed numbers and date calls."""
+    if isinstance(node, ast.Constant):
+        return node.value
+    if isinstance(node, (ast.List, ast.Tuple, ast.Set)):
+        # Nested containers are kept as tuples, so a shared parsed value cannot be changed by one of its rules
+        items = tuple(_literal_node_value(item) for item in node.elts)
+        return frozenset(items) if isinstance(node, ast.Set) else items
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.UAdd, ast.USub)) and isinstance(node.operand, ast.Constant) \
+            and isinstance(node.operand.value, (int, float, complex)) and not isinstance(node.operand.value, bool):
+        return node.operand.value if isinstance(node.op, ast.UAdd) else -node.operand.value
+    if isinstance(node, ast.Call) and ast.unparse(node.func) in RULE_VALUE_DATE_CALLS:
+        args = [_literal_node_value(arg) for arg in node.args]
+        kwargs = {keyword.arg: _literal_node_value(keyword.value) for keyword in node.keywords if keyword.arg}
+        if len(kwargs) != len(node.keywords):
+            raise ValueError("**arguments are not supported")
+        return RULE_VALUE_DATE_CALLS[ast.unparse(node.func)](*args, **kwargs)
+    raise ValueError(f"unsupported expression '{ast.unparse(node)}'")
+
+
+@lru_cache(maxsize=RULE_VALUE_CACHE_SIZE)
+def parse_literal(text: str) -> Any:
+    """
+    Parse a rule cell holding a literal: a number, string, date call or a list, tuple or set of them.
+    
+    Lists, tuples and sets become one frozenset (a tuple if they hold unhashable items), and identical cells
+    share the same object. Unlike `eval`, nothing but literals and the date calls above is ever run.
+    """
+    value = _literal_node_value(ast.parse(text.strip(), mode="eval").body)
+    if isinstance(value, tuple):
+        try:
+            return frozenset(value)
+        except TypeError:
+            return value
+    return value
+
+
+def parse_value(value_raw: Any, logger: logging.Logger) -> Any:
+    """Parse comma-separated values, handling special cases."""
+    # Handle empty or NaN values
+    if pd.isna(value_raw) or str(value_raw).strip() == '':
+        return None
+    
+    # Handle special values - Boolean
+    if value_raw == 1 or value_raw == '1':
+        return True
+    
+    # Handle special values - Date range
+    if value_raw.startswith("all dates in range: "):
+        range_part = value_raw.replace("all dates in range: ", "").strip()
+        
+        try:
+            # Extract start and end dates
+            start_str, end_str = range_part.split(' - ')
+            start_date = pd.to_datetime(start_str.strip())
+            end_date = pd.to_datetime(end_str.strip())
+            
+            if pd.isna(start_date) or pd.isna(end_date):
+                raise ValueError("Neither `start` nor `end` can be NaT")
+            
+            # Keep the range as an interval, its dates are checked arithmetically instead of one by one
+            vals = DateRange(start_date, end_date)
+            logger.debug(f"Parsed date range '{value_raw}' into {len(vals)} dates from {start_date.date()} to {end_date.date()}")   
+            return vals
+        except Exception as e:
+            logger.error(f"🐞 Failed to parse date range '{value_raw}': {e}")
+            sys.exit(1)
+    
+    # Handle list format (normal case)
+    try:
+        vals = parse_literal(value_raw)
+        return vals      
+    except Exception as e:
+        logger.error(f"🐞 Failed to parse values from '{value_raw}': {e}")
+        sys.exit(1)
+
+
+def parse_rules_to_validation_schema(rule: pd.Series, logger: logging.Logger) -> Dict[str, Any]:
+    """Convert validation rule to Cerberus schema format."""
+    logger.info(f"\n📝 Parsing rule with column being '{rule['column']}', scope being '{rule['scope']}'")
+    try:
+        column = rule['column']
+        allowed = parse_value(rule['allowed'], logger)
+        contains = parse_value(rule['contains'], logger)
+        not_empty = parse_value(rule['not_empty'], logger) 
+        
+        # Create Cerberus schema for this column. c.f. https://docs.python-cerberus.org/schemas.html
+        schema = {column: {}}
+        
+        # Add validation rules based on the new column format
+        if contains:
+            schema[column]['contains'] = contains
+        if allowed:
+            schema[column]['allowed'] = allowed
+        if not_empty:
+            schema[column]['empty'] = False
+        
+        logger.debug(f"Created validation schema: {schema}")
+        return schema
+        
+    except KeyError as e:
+        logger.error(f"🐞 Missing required column in rule: {e}")
+        sys.exit(1)
+    except Exception as e:
+        logger.error(f"🐞 Failed to parse rule to validation schema: {e}")
+        sys.exit(1)
+
+
+# Compiled rule plans are kept next to the rules file, e.g. `data_validation_rules.xlsx.plan.json`, and reused
+# while the file's size, modification time and content hash are unchanged. Bump the version when parsing changes.
+RULE_PLAN_SUFFIX = ".plan.json"
+RULE_PLAN_VERSION = 3
+
+# Parsed rule schemas and parsing logs by rules file version and sheet, then by rule row content (see
+# get_rule_row_key), shared by all runs in this process
+COMPILED_RULES: Dict[str, Dict[str, Tuple[Dict[str, Any], List[Tuple[int, str]]]]] = {}
+
+# Fields of a rule row its parsed schema and parsing messages depend on
+RULE_ROW_FIELDS = ("column", "scope", "allowed", "contains", "not_empty")
+
+
+def encode_rule_value(value: Any) -> List[Any]:
+    """Encode a parsed rule value (nested lists, tuples, sets and dicts of cell values) as typed JSON."""
+    if value is None:
+        return ["none", None]
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return [type(value).__name__, [encode_rule_value(item) for item in value]]
+    if isinstance(value, dict):
+        return ["dict", [[encode_rule_value(key), encode_rule_value(item)] for key, item in value.items()]]
+    if isinstance(value, DateRange):
+        return ["date_range", [encode_stats_value(value.start), encode_stats_value(value.end)]]
+    return encode_stats_value(value)
+
+
+def decode_rule_value(encoded: List[Any], shared: Optional[Dict[str, frozenset]] = None) -> Any:
+    """Decode a value written by `encode_rule_value`; equal frozensets are decoded once per `shared` dict."""
+    kind, value = encoded
+    if kind == "none":
+        return None
+    if kind == "frozenset" and shared is not None:
+        key = json.dumps(value)
+        if key not in shared:
+            shared[key] = frozenset(decode_rule_value(item, shared) for item in value)
+        return shared[key]
+    if kind in ("list", "tuple", "set", "frozenset"):
+        return {"list": list, "tuple": tuple, "set": set, "frozenset": frozenset}[kind](decode_rule_value(item, shared) for item in value)
+    if kind == "dict":
+        return {decode_rule_value(key, shared): decode_rule_value(item, shared) for key, item in value}
+    if kind == "date_range":
+        return DateRange(*(decode_stats_value(item) for item in value))
+    return decode_stats_value(encoded)
+
+
+def compile_rules(rule: pd.DataFrame) -> Optional[List[Tuple[Dict[str, Any], List[Tuple[int, str]]]]]:
+    """
+    Parse every rule into its validation schema, keeping the messages parsing logs for replay.
+    
+    Returns None if a rule fails to parse; such rules are parsed (and their errors reported) during validation.
+    """
+    compiled = []
+    for _, single_rule in rule.iterrows():
+        rule_log = RuleLog()
+        try:
+            rule_dict = parse_rules_to_validation_schema(single_rule, rule_log)
+        except SystemExit:
+            return None
+        compiled.append((rule_dict, rule_log.records))
+    return compiled
+
+
+def get_rule_row_key(single_rule: pd.Series) -> str:
+    """Identify a rule row by its content, so compiled rules follow their rows when the rules frame is reordered or edited."""
+    return repr(tuple(single_rule.get(field) for field in RULE_ROW_FIELDS))
+
+
+def index_compiled_rules(rule: pd.DataFrame, compiled: List[Tuple[Dict[str, Any], List[Tuple[int, str]]]]) -> Dict[str, Tuple[Dict[str, Any], List[Tuple[int, str]]]]:
+    """Key the compiled rules (in row order) by the content of their rows."""
+    return {get_rule_row_key(single_rule): entry for (_, single_rule), entry in zip(rule.iterrows(), compiled)}
+
+
+def find_compiled_rule(row_key: str, compiled: Dict[str, Tuple[Dict[str, Any], List[Tuple[int, str]]]]) -> Optional[Tuple[Dict[str, Any], List[Tuple[int, str]]]]:
+    """
+    Find the compiled rule of a row in the rules of its frame's rules file, else in those of any rules file loaded
+    in this process: a rule's schema and parsing messages only depend on the content of its row.
+    """
+    entry = compiled.get(row_key)
+    if entry is None:
+        entry = next((other[row_key] for other in COMPILED_RULES.values() if row_key in other), None)
+    return entry
+
+
+def get_rule_plan_key(fingerprint: Dict[str, Any]) -> str:
+    """Identify a rules file version and sheet, for compiled rules kept in this process."""
+    return json.dumps([RULE_PLAN_VERSION, fingerprint["path"], fingerprint["sheet"], fingerprint["size"],
+                       fingerprint["mtime_ns"], fingerprint["content_hash"]])
+
+
+def load_rule_plan(file_path: str, fingerprint: Dict[str, Any]) -> Optional[pd.DataFrame]:
+    """Load the rules of an unchanged rules file sheet from its compiled rule plan (None if there is none)."""
+    try:
+        with open(str(file_path) + RULE_PLAN_SUFFIX, encoding="utf-8") as f:
+            plan = json.load(f)
+        if plan["version"] != RULE_PLAN_VERSION or any(plan[key] != fingerprint[key] for key in ("size", "mtime_ns", "content_hash")):
+            return None
+        sheet_plan = plan["sheets"][fingerprint["sheet"]]
+        
+        # Value lists repeated across rules share one frozenset, as when they are parsed
+        shared = {}
+        rule = pd.DataFrame({
+            column: pd.Series([decode_rule_value(value) for value in values], dtype=dtype)
+            for column, dtype, values in zip(sheet_plan["columns"], sheet_plan["dtypes"], sheet_plan["values"])
+        })
+        compiled = [(decode_rule_value(rule_dict, shared), [tuple(record) for record in records])
+                    for rule_dict, records in sheet_plan["rules"]]
+        if len(compiled) != len(rule):
+            raise ValueError("rule plan does not match its rules")
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    
+    key = get_rule_plan_key(fingerprint)
+    COMPILED_RULES[key] = index_compiled_rules(rule, compiled)
+    rule.attrs["rule_plan_key"] = key
+    return rule
+
+
+def save_rule_plan(rule: pd.DataFrame, file_path: str, fingerprint: Dict[str, Any], logger: logging.Logger) -> None:
+    """Compile the rules of a rules file sheet and keep them for later runs, in this process and next to the file."""
+    compiled = compile_rules(rule)
+    if compiled is None:
+        return
+    key = get_rule_plan_key(fingerprint)
+    COMPILED_RULES[key] = index_compiled_rules(rule, compiled)
+    rule.attrs["rule_plan_key"] = key
+    
+    # Rules holding values that cannot be encoded (or a read-only folder) are simply compiled again next time
+    plan_path = str(file_path) + RULE_PLAN_SUFFIX
+    try:
+        sheet_plan = {
+            "columns": [str(column) for column in rule.columns],
+            "dtypes": [str(rule[column].dtype) for column in rule.columns],
+            "values": [[encode_rule_value(value) for value in rule[column]] for column in rule.columns],
+            "rules": [[encode_rule_value(rule_dict), records] for rule_dict, records in compiled],
+        }
+        try:
+            with open(plan_path, encoding="utf-8") as f:
+                plan = json.load(f)
+            if plan["version"] != RULE_PLAN_VERSION or any(plan[key] != fingerprint[key] for key in ("size", "mtime_ns", "content_hash")):
+                raise ValueError("outdated rule plan")
+        except (OSError, ValueError, KeyError, TypeError):
+            plan = {"version": RULE_PLAN_VERSION, **{key: fingerprint[key] for key in ("size", "mtime_ns", "content_hash")}, "sheets": {}}
+        plan["sheets"][fingerprint["sheet"]] = sheet_plan
+        
+        temp_path = f"{plan_path}.{os.getpid()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(plan, f)
+        os.replace(temp_path, plan_path)
+        logger.debug(f"Saved compiled rule plan: {plan_path}")
+    except (OSError, TypeError) as e:
+        logger.debug(f"Rule plan not saved to {plan_path}: {e}")
+
+
+# ---------------------------------------------------------------------
+# In-memory caches shared by rules
+# ---------------------------------------------------------------------
+
+# Default memory budget for derived partition keys (codes per row + distinct keys) kept during one run
+PARTITION_KEY_CACHE_BYTES = 256 * 1024 * 1024
+
+# Default memory budget for condition scope masks, kept across runs in the same process
+SCOPE_MASK_CACHE_BYTES = 64 * 1024 * 1024
+
+# Default memory budget for distinct values per (column, scope, partition) kept during one run
+DISTINCT_VALUE_CACHE_BYTES = 256 * 1024 * 1024
+
+# Number of elements sampled to estimate the size of object arrays
+ESTIMATE_SAMPLE_SIZE = 100
+
+# Sentinel for cache misses, so cached None values are still hits
+_MISSING = object()
+
+
+def estimate_nbytes(obj: Any) -> int:
+    """Estimate the memory held by a cached object (arrays, pandas objects and containers of them)."""
+    if isinstance(obj, np.ndarray):
+        if obj.dtype != object or not len(obj):
+            return obj.nbytes
+        # Size Python objects from a sample, so huge-cardinality arrays are not walked one element at a time
+        sample = obj.ravel()[:ESTIMATE_SAMPLE_SIZE]
+        return obj.nbytes + len(obj) * sum(sys.getsizeof(x) for x in sample) // len(sample)
+    if isinstance(obj, (pd.Series, pd.Index)):
+        return int(obj.memory_usage(deep=True))
+    if isinstance(obj, pd.api.extensions.ExtensionArray):
+        return int(obj.nbytes)
+    if isinstance(obj, (list, tuple)):
+        return sys.getsizeof(obj) + sum(estimate_nbytes(x) for x in obj)
+    return sys.getsizeof(obj)
+
+
+class LRUByteCache:
+    """Least-recently-used cache that evicts entries once their total estimated size exceeds a byte budget."""
+    
+    def __init__(self, max_bytes: int, name: str = "cache"):
+        self.max_bytes = max_bytes
+        self.name = name
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()  # key -> (value, nbytes), least recently used first
+        self._lock = threading.RLock()  # Partition threads share the caches of their run
+    
+    def __contains__(self, key: Any) -> bool:
+        return key in self._entries
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def get(self, key: Any, default: Any = None) -> Any:
+        """Return a cached value (marking it as recently used), or default on a miss."""
+        with self._lock:
+            if key not in self._entries:
+                self.misses += 1
+                return default
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return self._entries[key][0]
+    
+    def put(self, key: Any, value: Any, nbytes: Optional[int] = None) -> bool:
+        """Store a value, evicting least recently used entries to stay within budget. Returns False if it cannot fit."""
+        nbytes = estimate_nbytes(value) if nbytes is None else nbytes
+        with self._lock:
+            if key in self._entries:
+                self.current_bytes -= self._entries.pop(key)[1]
+            if nbytes > self.max_bytes:
+                return False
+            
+            self._evict_to(self.max_bytes - nbytes)
+            self._entries[key] = (value, nbytes)
+            self.current_bytes += nbytes
+            return True
+    
+    def get_or_compute(self, key: Any, compute: Callable[[], Any]) -> Any:
+        """Return the cached value for key, computing and caching it on a miss."""
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = compute()
+            self.put(key, value)
+        return value
+    
+    def resize(self, max_bytes: int) -> None:
+        """Change the byte budget, evicting least recently used entries if they no longer fit."""
+        with self._lock:
+            self.max_bytes = max_bytes
+            self._evict_to(max_bytes)
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+    
+    def summary(self) -> str:
+        return (f"{self.name}: {self.hits} hits, {self.misses} misses, {self.evictions} evictions, "
+                f"{len(self._entries)} entries ({self.current_bytes / (1024 * 1024):.2f} MB)")
+    
+    def _evict_to(self, max_bytes: int) -> None:
+        while self._entries and self.current_bytes > max_bytes:
+            _, (_, evicted_bytes) = self._entries.popitem(last=False)
+            self.current_bytes -= evicted_bytes
+            self.evictions += 1
+
+
+@dataclass
+class ScopeMask:
+    """Rows selected by a condition scope, stored as row positions or a packed bitmap, whichever is smaller."""
+    n_rows: int
+    packed: bool
+    array: np.ndarray
+    
+    @classmethod
+    def from_positions(cls, positions: np.ndarray, n_rows: int) -> "ScopeMask":
+        position_type = np.min_scalar_type(max(n_rows - 1, 0))
+        if len(positions) * position_type.itemsize <= (n_rows + 7) // 8:
+            return cls(n_rows, False, positions.astype(position_type))
+        
+        mask = np.zeros(n_rows, dtype=bool)
+        mask[positions] = True
+        return cls(n_rows, True, np.packbits(mask))
+    
+    def positions(self) -> np.ndarray:
+        if self.packed:
+            return np.flatnonzero(np.unpackbits(self.array, count=self.n_rows))
+        return self.array.astype(np.intp)
+
+
+# Condition scope masks keyed by (scope string, data version), shared by all runs in this process
+SCOPE_MASK_CACHE = LRUByteCache(SCOPE_MASK_CACHE_BYTES, name="Scope mask cache")
+
+
+def get_data_version(data_cleaned: pd.DataFrame, origin: Optional[DataOrigin] = None) -> str:
+    """
+    Identify the data content, for keys of caches that outlive one run.
+    
+    Data as loaded is identified by its source version for free. Anything else is hashed, column by column, once per
+    validation with condition scopes: for 2M rows about 0.04 s per numeric or date column and 0.2-0.4 s per text
+    column (0.6 s for 5 mixed columns), so callers that load data should pass its origin.
+    """
+    if origin is not None:
+        return f"{origin.version}|{list(data_cleaned.columns)}"
+    
+    # The index is not hashed: scope masks are row positions, whatever the labels of the rows
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr([(col, str(data_cleaned[col].dtype)) for col in data_cleaned.columns]).encode())
+    if len(data_cleaned.columns):
+        digest.update(pd.util.hash_pandas_object(data_cleaned, index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+# ---------------------------------------------------------------------
+# Partitioning for "each date of" / "each month of" scopes
+# ---------------------------------------------------------------------
+
+def derive_partition_keys(date_series: pd.Series, granularity: str) -> Tuple[np.ndarray, List[Any]]:
+    """Derive one partition code per row and the partition keys (in order of first appearance) in a single pass."""
+    if granularity == "date":
+        # Normalizing stays in datetime64, so Python date objects are only created for the distinct keys
+        codes, uniques = pd.factorize(date_series.dt.normalize(), use_na_sentinel=False)
+        keys = [pd.NaT if pd.isna(key) else key.date() for key in uniques]
+    elif granularity == "month":
+        codes, uniques = pd.factorize(date_series.dt.to_period("M"), use_na_sentinel=False)
+        keys = list(uniques)
+    else:
+        raise ValueError(f"Unknown partition granularity '{granularity}'")
+    
+    # Codes are non-negative (missing dates get their own key), so keep them in the smallest unsigned type
+    return codes.astype(np.min_scalar_type(max(len(keys) - 1, 0)), copy=False), keys
+
+
+def get_partition_keys(data: pd.DataFrame, date_column: str, granularity: str, key_cache: Optional[LRUByteCache]) -> Tuple[np.ndarray, List[Any]]:
+    """Get partition codes and keys for a date column, reusing ones derived by earlier rules in the same run."""
+    if key_cache is None:
+        return derive_partition_keys(data[date_column], granularity)
+    return key_cache.get_or_compute((date_column, granularity), lambda: derive_partition_keys(data[date_column], granularity))
+
+
+def split_positions_by_partition(values: pd.Series, codes: np.ndarray, keys: List[Any]) -> List[Tuple[Any, np.ndarray]]:
+    """
+    Find the first row of every distinct value in each partition with one hash pass and one stable sort.
+    
+    Returns (key, row positions) pairs in the order of `keys`; positions are in order of first appearance.
+    """
+    # First occurrence of every (partition, value) pair, then group those positions by partition
+    is_first = ~pd.DataFrame({"key": codes, "value": values.array}).duplicated().to_numpy()
+    positions = np.flatnonzero(is_first)
+    position_codes = codes[positions]
+    positions = positions[np.argsort(position_codes, kind="stable")]
+    bounds = np.concatenate(([0], np.cumsum(np.bincount(position_codes, minlength=len(keys)))))
+    
+    partitions = []
+    for code, key in enumerate(keys):
+        # A missing date never equals itself, so its partition matches no rows (same as comparing with `==`)
+        if pd.isna(key):
+            partitions.append((key, positions[:0]))
+        else:
+            partitions.append((key, positions[bounds[code]:bounds[code + 1]]))
+    
+    return partitions
+
+
+# ---------------------------------------------------------------------
+# Validation functions
+# ---------------------------------------------------------------------
+
+# Engines available to check one rule: "native" uses pandas/NumPy set operations and falls back to Cerberus
+# for anything it does not understand, "cerberus" always builds a Cerberus Validator
+VALIDATION_ENGINES = ("native", "cerberus")
+
+# Rules the native engine can check, in the order Cerberus reports their errors (sorted by rule name)
+NATIVE_RULES = ("allowed", "contains", "empty")
+
+
+def _to_object_array(values: Any) -> np.ndarray:
+    """Convert values to a 1-D object array without letting NumPy reinterpret nested or datetime values."""
+    if isinstance(values, (np.ndarray, pd.api.extensions.ExtensionArray, pd.Index, pd.Series)):
+        return np.asarray(values, dtype=object).ravel()
+    
+    values = list(values)
+    array = np.empty(len(values), dtype=object)
+    array[:] = values
+    return array
+
+
+def validate_values_native(data_dict: Dict[str, Any], rule_dict: Dict[str, Any]) -> Optional[Dict[str, List[str]]]:
+    """
+    Check allowed / contains / empty rules with vectorized set operations.
+    
+    Returns the errors in the same shape and wording as `Validator.errors`, or None if the schema uses
+    anything the native engine does not support (the caller then falls back to Cerberus).
+    """
+    if set(data_dict) != set(rule_dict):
+        return None
+    
+    errors = {}
+    for field, definitions in rule_dict.items():
+        if not isinstance(definitions, dict) or set(definitions) - set(NATIVE_RULES):
+            return None
+        
+        # Keep the original array for reporting so values are shown exactly as Cerberus would show them
+        values = data_dict[field]
+        if not isinstance(values, (np.ndarray, pd.api.extensions.ExtensionArray, list, tuple)):
+            return None
+        values_obj = _to_object_array(values)
+        
+        # Empty check comes first in Cerberus, and an empty value skips the 'allowed' check
+        is_empty = len(values_obj) == 0
+        field_errors = {}
+        if "empty" in definitions:
+            if not isinstance(definitions["empty"], bool):
+                return None
+            if is_empty and not definitions["empty"]:
+                field_errors["empty"] = "empty values not allowed"
+        
+        if "allowed" in definitions and not is_empty:
+            allowed = definitions["allowed"]
+            if isinstance(allowed, DateRange):
+                is_allowed = allowed.isin(values)
+            elif isinstance(allowed, (str, bytes)) or not isinstance(allowed, Container) or not isinstance(allowed, Iterable):
+                return None
+            else:
+                is_allowed = pd.Series(values_obj, dtype=object).isin(_to_object_array(allowed)).to_numpy()
+            if not is_allowed.all():
+                unallowed = tuple(values[i] for i in np.flatnonzero(~is_allowed))
+                field_errors["allowed"] = f"unallowed values {unallowed}"
+        
+        if "contains" in definitions:
+            expected = definitions["contains"]
+            if isinstance(expected, DateRange):
+                is_complete = expected.is_covered_by(values)
+            else:
+                if not isinstance(expected, Iterable) or isinstance(expected, (str, bytes)):
+                    expected = (expected,)
+                is_complete = pd.Series(_to_object_array(expected), dtype=object).isin(values_obj).to_numpy().all()
+            if not is_complete:
+                # Only build Python sets on the failure path; Cerberus deep-copies the set before formatting it,
+                # which can change its iteration order, so do the same to get an identical message
+                missing = copy.deepcopy(set(expected) - set(values))
+                field_errors["contains"] = f"missing members {missing}"
+        
+        if field_errors:
+            errors[field] = [field_errors[rule_name] for rule_name in NATIVE_RULES if rule_name in field_errors]
+    
+    return errors
+
+
+class ValidatorPool:
+    """
+    Cerberus validators compiled once from one rule's schema and reused for every partition.
+    
+    Each thread borrows its own validator, since a validator keeps the state of the document it is validating.
+    """
+    
+    def __init__(self, rule_dict: Dict[str, Any]):
+        self.rule_dict = rule_dict
+        self.compiled = 0
+        self._idle = []
+        self._lock = threading.Lock()
+    
+    @contextmanager
+    def borrow(self) -> Iterator[cerberus.Validator]:
+        with self._lock:
+            validator = self._idle.pop() if self._idle else None
+        if validator is None:
+            validator = cerberus.Validator(self.rule_dict)
+            self.compiled += 1
+        try:
+            yield validator
+        finally:
+            with self._lock:
+                self._idle.append(validator)
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        # Sent to worker processes without compiled validators, each worker compiles its own
+        return {"rule_dict": self.rule_dict}
+    
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__init__(state["rule_dict"])
+
+
+def validate_data_single_rule(data_dict: Dict[str, Any], rule_dict: Dict[str, Any], logger: logging.Logger,
+                              engine: str = "native", validators: Optional[ValidatorPool] = None) -> bool:
+    """Validate one column (pd.Series) using Cerberus schema coming from one row in the rule file."""
+    errors = None
+    
+    # Validate with vectorized set operations where possible
+    if engine == "native":
+        errors = validate_values_native(data_dict, rule_dict)
+        if errors is None:
+            logger.debug(f"Native engine does not support schema {rule_dict}, falling back to Cerberus")
+    
+    # Validate using Cerberus, reusing the rule's compiled validators when available
+    if errors is None:
+        if validators is None:
+            validators = ValidatorPool(rule_dict)
+        with validators.borrow() as validator:
+            validator.validate(data_dict)
+            errors = validator.errors
+
+    if not errors:
+        logger.info("✅ PASS - All validations passed")
+        return True
+    else:
+        logger.error("❌ FAIL - These errors are found:")
+        for field, field_errors in errors.items():
+            for error in field_errors:
+                logger.error(f"  - {field}: {error}")
+        return False
+
+
+# ---------------------------------------------------------------------
+# Rule execution plan
+# ---------------------------------------------------------------------
+
+class RuleLog:
+    """Buffer of log records for one rule, replayed in rule order once the rule has been executed."""
+    
+    def __init__(self):
+        self.records = []  # (level, message)
+    
+    def debug(self, msg: str) -> None:
+        self.records.append((logging.DEBUG, msg))
+    
+    def info(self, msg: str) -> None:
+        self.records.append((logging.INFO, msg))
+    
+    def warning(self, msg: str) -> None:
+        self.records.append((logging.WARNING, msg))
+    
+    def error(self, msg: str) -> None:
+        self.records.append((logging.ERROR, msg))
+    
+    def extend(self, other: "RuleLog") -> None:
+        self.records.extend(other.records)
+    
+    def replay(self, logger: logging.Logger) -> None:
+        for level, msg in self.records:
+            logger.log(level, msg)
+
+
+@dataclass
+class PlannedRule:
+    """One rule (a row in the rule Excel file) compiled into a validation schema."""
+    position: int  # Row order in the rule file, used to report results in the original order
+    column: str
+    rule_dict: Dict[str, Any]
+    log: RuleLog
+    validators: ValidatorPool  # Compiled once per rule, reused by every partition
+
+
+@dataclass
+class ScopeGroup:
+    """All rules sharing one scope, whose row selection is evaluated once for the whole group."""
+    scope: str
+    rules: List[PlannedRule]
+
+
+@dataclass
+class RuleResult:
+    """Outcome of one rule: passed is None when the rule was skipped and is not counted."""
+    position: int
+    passed: Optional[bool]
+    log: RuleLog
+
+
+@dataclass
+class RunContext:
+    """Everything the rules of one validation run share: the data, its cleaned view, caches and settings."""
+    data: pd.DataFrame
+    data_cleaned: pd.DataFrame
+    key_cache: Optional[LRUByteCache]
+    engine: str = "native"
+    partition_workers: int = 1
+    mask_cache: Optional[LRUByteCache] = None
+    distinct_cache: Optional[LRUByteCache] = None
+    data_version: str = ""  # Computed on the first condition scope when empty, see get_condition_rows
+    mask_hits: int = 0
+    mask_misses: int = 0
+
+
+def build_rule_plan(rule: pd.DataFrame, logger: logging.Logger) -> List[ScopeGroup]:
+    """Compile the rules into scope groups, in the order each scope first appears in the rule file."""
+    # Rules loaded from an unchanged rules file are already parsed, their parsing messages are replayed. Compiled
+    # rules are looked up by row content, since the frame may have been reordered, edited or extended since it was
+    # loaded (frames built with pd.concat lose the key of their rules file, see find_compiled_rule)
+    compiled = COMPILED_RULES.get(rule.attrs.get("rule_plan_key"), {})
+    
+    groups = {}
+    for position, (idx, single_rule) in enumerate(rule.iterrows()):
+        column = single_rule["column"].strip()
+        scope = single_rule["scope"].strip()
+        
+        rule_log = RuleLog()
+        entry = find_compiled_rule(get_rule_row_key(single_rule), compiled) if COMPILED_RULES else None
+        if entry is not None:
+            # Validators must not share (and change) one schema; its parsed values are immutable and stay shared
+            rule_dict = {field: dict(definitions) for field, definitions in entry[0].items()}
+            rule_log.records.extend(entry[1])
+        else:
+            # parse rules to validation schema (dictionary), logging into the rule's own buffer
+            try:
+                rule_dict = parse_rules_to_validation_schema(single_rule, rule_log)
+            except SystemExit:
+                # Parsing errors stop the run, make sure their messages are not lost in the buffer
+                rule_log.replay(logger)
+                raise
+        
+        groups.setdefault(scope, ScopeGroup(scope, [])).rules.append(PlannedRule(position, column, rule_dict, rule_log, ValidatorPool(rule_dict)))
+    
+    return list(groups.values())
+
+
+def execute_scope_group(group: ScopeGroup, context: RunContext) -> List[RuleResult]:
+    """Select the rows of one scope once, then validate every rule of the group against them."""
+    data, data_cleaned, engine = context.data, context.data_cleaned, context.engine
+    scope = group.scope
+    results = []
+    
+    # No scope -> validate entire column
+    if scope == '':
+        for planned in group.rules:
+            column, rule_dict, rule_log = planned.column, planned.rule_dict, planned.log
+            rule_log.info(f"\n📏 Validating Column '{column}' on full dataset")
+            data_dict = {column: get_distinct_values(context, column, scope, None, lambda: data_cleaned[column].unique())}
+            result = validate_data_single_rule(data_dict, rule_dict, rule_log, engine, planned.validators)
+            results.append(RuleResult(planned.position, result, rule_log))
+    
+    # Special scope options "each month/date of: <date_column>"
+    elif scope.startswith("each"):
+        
+        # Check if date_column exists and is datetime type
+        date_column = scope.split(":", 1)[-1].strip()
+        scope_error = None
+        if date_column not in data.columns:
+            scope_error = f"🐞 Date column '{date_column}' not found in data"
+        elif not pd.api.types.is_datetime64_any_dtype(data[date_column]):
+            scope_error = f"🐞 Column '{date_column}' is not a datetime column, found type: {data[date_column].dtype}"
+        if scope_error:
+            for planned in group.rules:
+                planned.log.error(scope_error)
+                results.append(RuleResult(planned.position, None, planned.log))
+            return results
+        
+        # Validate for each date / each month, partitions are derived once per scope in a single pass
+        if scope.startswith("each date of"):
+            granularity = "date"
+        elif scope.startswith("each month of"):
+            granularity = "month"
+        else:
+            for planned in group.rules:
+                planned.log.error(f"🐞 Unknown 'each' scope format: '{scope}', currrently only supports 'each date of: <date_column>' and 'each month of: <date_column>'")
+                results.append(RuleResult(planned.position, False, planned.log))
+            return results
+        
+        # Use original data for partition keys, cleaned data for validation
+        codes, keys = get_partition_keys(data, date_column, granularity, context.key_cache)
+        
+        for planned in group.rules:
+            result = validate_partitions(planned, scope, date_column, codes, keys, context)
+            results.append(RuleResult(planned.position, result, planned.log))
+    
+    # Regular condition scope
+    else:
+        # Select rows matching the condition once for all rules of the group
+        try:
+            positions = get_condition_rows(context, scope)
+            scope_error = None
+        except Exception as e:
+            positions = None
+            scope_error = e
+        
+        for planned in group.rules:
+            column = planned.column
+            get_values = lambda: get_distinct_values(context, column, scope, None,
+                                                     lambda: data_cleaned[column].take(positions).unique())
+            results.append(validate_condition_rule(planned, scope, scope_error, get_values, engine))
+    
+    return results
+
+
+def validate_partitions(planned: PlannedRule, scope: str, date_column: str, codes: np.ndarray, keys: List[Any],
+                        context: RunContext) -> bool:
+    """Validate every date/month partition of one rule, reusing distinct values cached by earlier rules."""
+    column = planned.column
     
-    if not cache_files:
-        return None
+    # Distinct values already computed by an earlier rule on the same column and scope are reused as they are,
+    # the rows are only split into partitions if some are missing
+    cached = [get_distinct_values(context, column, scope, key, None) for key in keys]
+    partitions = None
+    if any(values is _MISSING for values in cached):
+        partitions = split_positions_by_partition(context.data_cleaned[column], codes, keys)
     
-    # Sort by modification time and return the most recent
-    cache_files.sort(key=os.path.getmtime, reverse=True)
-    return cache_files[0]
+    def get_partition_values(code: int) -> Any:
+        values = cached[code]
+        if values is _MISSING:
+            values = context.data_cleaned[column].iloc[partitions[code][1]].unique()
+            put_distinct_values(context, column, scope, keys[code], values)
+        return values
+    
+    return validate_partition_values(planned, date_column, keys, get_partition_values, context.engine, context.partition_workers)
 
 
-def save_data_cache(df: pd.DataFrame, logger: logging.Logger) -> None:
-    """Save dataframe to parquet cache file with timestamp."""
-    script_dir = get_project_root()
+def validate_partition_values(planned: PlannedRule, date_column: str, keys: List[Any], get_values: Callable[[int], Any],
+                              engine: str, partition_workers: int) -> bool:
+    """Validate the distinct values of every date/month partition of one rule, on a thread pool when partition workers are configured."""
+    column, rule_dict = planned.column, planned.rule_dict
     
-    # Remove existing cache files before creating new one
-    cache_pattern = str(script_dir / "data/data cached *.parquet")
-    existing_cache_files = glob.glob(cache_pattern)
+    def validate_partition(code: int) -> Tuple[bool, RuleLog]:
+        partition_log = RuleLog()
+        partition_log.info(f"\n📏 Validating Column '{column}' where `{str(date_column)}` == '{str(keys[code])}'")
+        data_dict = {column: get_values(code)}
+        passed = validate_data_single_rule(data_dict, rule_dict, partition_log, engine, planned.validators)
+        return passed, partition_log
     
-    if existing_cache_files:
-        for cache_file in existing_cache_files:
-            try:
-                os.remove(cache_file)
-                logger.info(f"\n🗑️ Removed old cache file: {os.path.basename(cache_file)}")
-            except Exception as e:
-                logger.error(f"\n🐞 Failed to remove old cache file {os.path.basename(cache_file)}: {e}")
+    # pandas/NumPy work on each partition releases the GIL for the most part; map keeps partitions in order
+    if partition_workers > 1 and len(keys) > 1:
+        with futures.ThreadPoolExecutor(max_workers=min(partition_workers, len(keys))) as pool:
+            outcomes = list(pool.map(validate_partition, range(len(keys))))
     else:
-        logger.info("🗑️ No existing cache files to remove.")
+        outcomes = [validate_partition(code) for code in range(len(keys))]
+    
+    # Monitor validation status for all months/dates, the rule passes only if every partition passes
+    result = True
+    for passed, partition_log in outcomes:
+        planned.log.extend(partition_log)
+        if not passed:
+            result = False
+    return result
+
+
+def validate_condition_rule(planned: PlannedRule, scope: str, scope_error: Optional[Exception],
+                            get_values: Callable[[], Any], engine: str) -> RuleResult:
+    """Validate one rule against the distinct values of the rows matching its condition scope."""
+    column, rule_dict, rule_log = planned.column, planned.rule_dict, planned.log
     
-    # Create new cache file
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    cache_filename = f"data cached {timestamp}.parquet"
-    cache_path = os.path.join(script_dir, cache_filename)
+    # Validate rows matching the condition
+    rule_log.info(f"\n📏 Validating Column '{column}' where '{scope}'")
+    if scope_error is not None:
+        rule_log.error(f"🐞 Failed to evaluate condition '{scope}': {scope_error}")
+        return RuleResult(planned.position, False, rule_log)
     
     try:
-        df.to_parquet(cache_path, index=False)
-        logger.info(f"\n📦 Data cached successfully: {cache_filename}")
-    except Exception as e:
-        logger.error(f"\n🐞 Failed to save data cache: {e}")
-        
-        
-def load_data(file_path: str, sheet_name: str, logger: logging.Logger) -> pd.DataFrame:
-    """Load data from Excel file or cache."""
-    # Option 1: Load from cache parquet file
-    if file_path == "use_cache":
-        cache_file = get_latest_data_cache()
-        
-        # Error handling: no cache file found
-        if cache_file is None:
-            logger.error("🐞 No cache file found. Please run with actual data file first to create cache.")
-            sys.exit(1)
-        
-        # Load from cache parquet file
-        try:
-            file_size = os.path.getsize(cache_file) / (1024 * 1024)  # Convert to MB
-            logger.info(f"\n📊 Loading data from cache: {os.path.basename(cache_file)}, Size: {file_size:.2f} MB")
-            df = pd.read_parquet(cache_file)
-            logger.info(textwrap.dedent(f"""
-                📊 Data Load Summary (from Cache)
-                - File: {os.path.basename(cache_file)}
-                - Shape: {df.shape}
-                - Columns: {', '.join([f'{col} ({df[col].dtype})' for col in df.columns])}"""))
-            
-            return df
+        data_dict = {column: get_values()}
+        if not data_dict[column].size:
+            rule_log.warning(f"⚠️ No rows match the condition '{scope}'. Skipping this rule.")
+            return RuleResult(planned.position, None, rule_log)
         
-        except Exception as e:
-            logger.error(f"🐞 Failed to load cache file {cache_file}: {e}")
-            sys.exit(1)
+        result = validate_data_single_rule(data_dict, rule_dict, rule_log, engine, planned.validators)
     
-    # Option 2: Load from Excel file
-    else:
-        # Load from Excel file
-        try:
-            file_size = os.path.getsize(file_path) / (1024 * 1024)  # Convert to MB
-            logger.info(f"\n📊 Loading data from Excel: {file_path}, Sheet: {sheet_name}, Size: {file_size:.2f} MB")
-            df = pd.read_excel(file_path, sheet_name=sheet_name, keep_default_na=False, na_values=[""])
-            logger.info(textwrap.dedent(f"""
-                📊 Data Load Summary (from Original File)
-                - File: {file_path}
-                - Sheet: {sheet_name}
-                - Shape: {df.shape}
-                - Columns: {', '.join([f'{col} ({df[col].dtype})' for col in df.columns])}"""))
-            # Save to parquet cache (every time we load from Excel)
-            save_data_cache(df, logger)
-            
-            return df
-        
-        except Exception as e:
-            logger.error(f"🐞 Failed to load data from {file_path}: {e}")
-            sys.exit(1)
+    except Exception as e:
+        rule_log.error(f"🐞 Failed to evaluate condition '{scope}': {e}")
+        result = False
+    
+    return RuleResult(planned.position, result, rule_log)
 
 
-def load_rules(file_path: str, sheet_name: str, logger: logging.Logger) -> pd.DataFrame:
-    """Load validation rules from Excel file."""
-    try:
-        logger.info(f"\n🚦 Loading rules from Excel: {file_path}, Sheet: {sheet_name}")
-        df = pd.read_excel(file_path, sheet_name=sheet_name, keep_default_na=False) # Empty cells will be parsed as '' instead of NaN
-        logger.info(textwrap.dedent(f"""
-            🚦 Rule Load Summary
-            - File: {file_path}
-            - Sheet: {sheet_name}
-            - Shape: {df.shape}
-            - Columns: {', '.join([f'{col} ({df[col].dtype})' for col in df.columns])}"""))
-        
-        return df
+def get_distinct_values(context: RunContext, column: str, scope: str, partition_key: Any,
+                        compute: Optional[Callable[[], Any]]) -> Any:
+    """
+    Get the distinct values of a column within a scope (and partition) from the run's distinct value cache.
     
-    except Exception as e:
-        logger.error(f"🐞 Failed to load rules from {file_path}: {e}")
-        sys.exit(1)
+    On a miss, the values are computed and cached, or `_MISSING` is returned when no compute function is given.
+    """
+    if context.distinct_cache is None:
+        return compute() if compute is not None else _MISSING
+    
+    values = context.distinct_cache.get((column, scope, partition_key), _MISSING)
+    if values is _MISSING and compute is not None:
+        values = compute()
+        put_distinct_values(context, column, scope, partition_key, values)
+    return values
 
 
-# ---------------------------------------------------------------------
-# Preprocessing Data
-# ---------------------------------------------------------------------
+def put_distinct_values(context: RunContext, column: str, scope: str, partition_key: Any, values: Any) -> None:
+    """Store distinct values in the run's cache; arrays too large for the budget are simply not kept."""
+    if context.distinct_cache is not None:
+        context.distinct_cache.put((column, scope, partition_key), values)
 
-def preprocess_data(data: pd.DataFrame, logger: logging.Logger) -> pd.DataFrame:
-    """preprocess data before validation."""
-    data_processed = data.copy()
 
-    # # Convert NaN values in non-numeric or datetime columns to empty strings
-    # for column in data_processed.columns:
-    #     if not pd.api.types.is_numeric_dtype(data_processed[column]) or pd.api.types.is_datetime64_any_dtype(data_processed[column]):
-    #         data_processed[column] = data_processed[column].fillna('')
-    #         logger.debug(f"Converted NaN values to empty strings in non-numeric column '{column}'")
+def decode_distinct_values(encoded: List[Any], dtype: Any) -> Any:
+    """Rebuild distinct values from cache statistics as the same array type `Series.unique` gives for the column."""
+    series = pd.Series([decode_stats_value(value) for value in encoded], dtype=object)
+    if dtype != object:
+        series = series.astype(dtype)
+    return series.unique()
 
-    logger.info("\n🏗️ Data preprocessing completed: (placeholder, currently nothing is changed)")
-    return data_processed
 
+def get_stats_distinct_values(plan: List[ScopeGroup], stats: Dict[str, Any], data_cleaned: pd.DataFrame) -> Dict[Tuple[Any, str, Any], Any]:
+    """
+    Distinct values of full-dataset and "each month of" rules held by the statistics of a cache file, keyed like
+    the distinct value cache. Only columns whose row count and cleaned dtype match the statistics are taken.
+    """
+    column_stats = stats.get("columns", {})
+    by_month = stats.get("by_month", {})
+    distinct_values = {}
+    for group in plan:
+        scope = group.scope
+        for planned in group.rules:
+            column = planned.column
+            if column not in data_cleaned.columns or column_stats.get(str(column), {}).get("dtype") != str(data_cleaned[column].dtype) \
+                    or column_stats[str(column)].get("rows") != len(data_cleaned):
+                continue
+            dtype = data_cleaned[column].dtype
+            
+            if scope == '' and "distinct" in column_stats[str(column)]:
+                distinct_values[(column, scope, None)] = decode_distinct_values(column_stats[str(column)]["distinct"], dtype)
+            
+            elif scope.startswith("each month of") and scope.split(":", 1)[-1].strip() == by_month.get("column"):
+                months = by_month["months"]
+                if all(str(column) in month_stats for month_stats in months.values()):
+                    for key, month_stats in months.items():
+                        partition_key = pd.NaT if key == "NaT" else pd.Period(key, "M")
+                        distinct_values[(column, scope, partition_key)] = decode_distinct_values(month_stats[str(column)], dtype)
+    
+    return distinct_values
 
-# ---------------------------------------------------------------------
-# Parsing conditions and validation
-# ---------------------------------------------------------------------
 
-def parse_value(value_raw: Any, logger: logging.Logger) -> Any:
-    """Parse comma-separated values, handling special cases."""
-    # Handle empty or NaN values
-    if pd.isna(value_raw) or str(value_raw).strip() == '':
-        return None
+def get_condition_rows(context: RunContext, scope: str) -> np.ndarray:
+    """Get the positions of rows matching a condition scope, from the scope mask cache when possible."""
+    if context.mask_cache is None:
+        return select_condition_rows(context.data_cleaned, scope)
     
-    # Handle special values - Boolean
-    if value_raw == 1 or value_raw == '1':
-        return True
+    # Hashing the data only pays off for condition scopes, so the version of data without an origin is computed here
+    if not context.data_version:
+        context.data_version = get_data_version(context.data_cleaned)
     
-    # Handle special values - Date range
-    if value_raw.startswith("all dates in range: "):
-        range_part = value_raw.replace("all dates in range: ", "").strip()
-        
-        try:
-            # Extract start and end dates
-            start_str, end_str = range_part.split(' - ')
-            start_date = pd.to_datetime(start_str.strip())
-            end_date = pd.to_datetime(end_str.strip())
-            
-            # Generate all dates in the range
-            date_range = pd.date_range(start=start_date, end=end_date, freq='D')            
-            
-            # Convert to string format to match how data is stored
-            vals = [pd.Timestamp(date) for date in date_range]
-            logger.debug(f"Parsed date range '{value_raw}' into {len(vals)} dates from {start_date.date()} to {end_date.date()}")   
-            return vals
-        except Exception as e:
-            logger.error(f"🐞 Failed to parse date range '{value_raw}': {e}")
-            sys.exit(1)
+    key = (scope, context.data_version)
+    mask = context.mask_cache.get(key)
+    if mask is not None:
+        context.mask_hits += 1
+        return mask.positions()
     
-    # Handle list format (normal case)
-    try:
-        vals = eval(value_raw)
-        return vals      
-    except Exception as e:
-        logger.error(f"🐞 Failed to parse values from '{value_raw}': {e}")
-        sys.exit(1)
+    context.mask_misses += 1
+    positions = select_condition_rows(context.data_cleaned, scope)
+    mask = ScopeMask.from_positions(positions, len(context.data_cleaned))
+    context.mask_cache.put(key, mask, mask.array.nbytes)
+    return positions
 
 
-def parse_rules_to_validation_schema(rule: pd.Series, logger: logging.Logger) -> Dict[str, Any]:
-    """Convert validation rule to Cerberus schema format."""
-    logger.info(f"\n📝 Parsing rule with column being '{rule['column']}', scope being '{rule['scope']}'")
-    try:
-        column = rule['column']
-        allowed = parse_value(rule['allowed'], logger)
-        contains = parse_value(rule['contains'], logger)
-        not_empty = parse_value(rule['not_empty'], logger) 
-        
-        # Create Cerberus schema for this column. c.f. https://docs.python-cerberus.org/schemas.html
-        schema = {column: {}}
-        
-        # Add validation rules based on the new column format
-        if contains:
-            schema[column]['contains'] = contains
-        if allowed:
-            schema[column]['allowed'] = allowed
-        if not_empty:
-            schema[column]['empty'] = False
-        
-        logger.debug(f"Created validation schema: {schema}")
-        return schema
-        
-    except KeyError as e:
-        logger.error(f"🐞 Missing required column in rule: {e}")
-        sys.exit(1)
-    except Exception as e:
-        logger.error(f"🐞 Failed to parse rule to validation schema: {e}")
-        sys.exit(1)
+def select_condition_rows(data_cleaned: pd.DataFrame, scope: str) -> np.ndarray:
+    """Evaluate a condition scope and return the positions of matching rows (same selection as DataFrame.query)."""
+    mask = data_cleaned.eval(scope)
+    if isinstance(mask, pd.Series) and pd.api.types.is_bool_dtype(mask.dtype):
+        return np.flatnonzero(mask.to_numpy(dtype=bool, na_value=False))
+    
+    # Anything else is resolved by query itself, on a positional index
+    return data_cleaned.reset_index(drop=True).query(scope).index.to_numpy()
 
 
-# ---------------------------------------------------------------------
-# Validation functions
-# ---------------------------------------------------------------------
+# Context of a validation worker process: the loaded data is inherited through fork where available, otherwise
+# sent once per worker by the pool initializer, so tasks only carry their (small) scope group
+_WORKER_CONTEXT: Optional[RunContext] = None
 
-def validate_data_single_rule(data_dict: Dict[str, Any], rule_dict: Dict[str, Any], logger: logging.Logger) -> None:
-    """Validate one column (pd.Series) using Cerberus schema coming from one row in the rule file."""
-    # Validate using Cerberus
-    validator = Validator(rule_dict)
-    is_valid = validator.validate(data_dict)
 
-    if is_valid:
-        logger.info("✅ PASS - All validations passed")
-        return True
+def _init_worker(data: pd.DataFrame, columns: List[Any], engine: str, partition_workers: int,
+                 data_version: str, mask_cache_bytes: int, distinct_values: Dict[Tuple[Any, str, Any], Any]) -> None:
+    """Set up a spawned worker process with the data it validates (and distinct values known from cache statistics)."""
+    global _WORKER_CONTEXT
+    SCOPE_MASK_CACHE.resize(mask_cache_bytes)
+    _WORKER_CONTEXT = RunContext(
+        data=data,
+        data_cleaned=build_cleaned_data(data, columns, logging.getLogger(__name__)),
+        key_cache=LRUByteCache(PARTITION_KEY_CACHE_BYTES, name="Partition key cache"),
+        engine=engine,
+        partition_workers=partition_workers,
+        mask_cache=SCOPE_MASK_CACHE,
+        distinct_cache=LRUByteCache(DISTINCT_VALUE_CACHE_BYTES, name="Distinct value cache"),
+        data_version=data_version,
+    )
+    for key, values in distinct_values.items():
+        _WORKER_CONTEXT.distinct_cache.put(key, values)
+
+
+def _execute_scope_group_in_worker(group: ScopeGroup) -> Tuple[List[RuleResult], Tuple[int, int]]:
+    """Execute one scope group against the data held by this worker process, with its scope mask cache hits/misses."""
+    context = _WORKER_CONTEXT
+    hits, misses = context.mask_hits, context.mask_misses
+    results = execute_scope_group(group, context)
+    return results, (context.mask_hits - hits, context.mask_misses - misses)
+
+
+def execute_rule_plan(plan: List[ScopeGroup], context: RunContext, workers: int, logger: logging.Logger,
+                      distinct_values: Optional[Dict[Tuple[Any, str, Any], Any]] = None) -> List[RuleResult]:
+    """Execute all scope groups, spread across a process pool when more than one worker is requested."""
+    global _WORKER_CONTEXT
+    workers = min(workers, len(plan))
+    if workers <= 1:
+        results = []
+        for group in plan:
+            results.extend(execute_scope_group(group, context))
+        return results
+    
+    # Workers would each hash the data for their condition scopes, so the version is computed once here instead
+    if not context.data_version and any(group.scope and not group.scope.startswith("each") for group in plan):
+        context.data_version = get_data_version(context.data_cleaned)
+    
+    # Forked workers share the parent's data copy-on-write; spawned workers receive it once through the initializer
+    if "fork" in multiprocessing.get_all_start_methods():
+        DATA_CACHE.join()  # Forking while a cache writer thread runs could copy its locks in a held state
+        mp_context = multiprocessing.get_context("fork")
+        _WORKER_CONTEXT = context
+        initializer, initargs = None, ()
     else:
-        logger.error("❌ FAIL - These errors are found:")
-        for field, errors in validator.errors.items():
-            for error in errors:
-                logger.error(f"  - {field}: {error}")
-        return False
+        mp_context = multiprocessing.get_context()
+        initializer = _init_worker
+        initargs = (context.data, list(context.data_cleaned.columns), context.engine, context.partition_workers,
+                    context.data_version, SCOPE_MASK_CACHE.max_bytes, distinct_values or {})
+    
+    logger.debug(f"Executing {len(plan)} scope groups on {workers} worker processes ({mp_context.get_start_method()})")
+    try:
+        with futures.ProcessPoolExecutor(max_workers=workers, mp_context=mp_context, initializer=initializer, initargs=initargs) as pool:
+            results = []
+            for group_results, (mask_hits, mask_misses) in pool.map(_execute_scope_group_in_worker, plan):
+                results.extend(group_results)
+                context.mask_hits += mask_hits
+                context.mask_misses += mask_misses
+            return results
+    finally:
+        _WORKER_CONTEXT = None
+
+
+def check_validation_settings(engine: str, workers: int, partition_workers: int, logger: logging.Logger) -> None:
+    """Stop the run on an unknown engine or a non-positive number of workers."""
+    if engine not in VALIDATION_ENGINES:
+        logger.error(f"🐞 Unknown validation engine '{engine}', currently only supports: {', '.join(VALIDATION_ENGINES)}")
+        sys.exit(1)
+    if workers < 1 or partition_workers < 1:
+        logger.error(f"🐞 Number of workers must be at least 1, got workers={workers}, partition_workers={partition_workers}")
+        sys.exit(1)
 
 
-def validate_data(data: pd.DataFrame, rule: pd.DataFrame, logger: logging.Logger) -> bool:
-    """Validate all data against all rules."""
+def report_rule_results(results: List[RuleResult], logger: logging.Logger) -> Tuple[int, int]:
+    """Replay the rule logs in the original rule order (i.e. the row order in the rule Excel file) and count passes/failures."""
     passed_count = 0
     failed_count = 0
+    for result in sorted(results, key=lambda result: result.position):
+        result.log.replay(logger)
+        
+        # Count results, skipped rules are not counted
+        if result.passed is None:
+            continue
+        if result.passed:
+            passed_count += 1
+        else:
+            failed_count += 1
+    
+    return passed_count, failed_count
+
+
+def validate_data(data: pd.DataFrame, rule: pd.DataFrame, logger: logging.Logger, engine: str = "native",
+                  workers: int = 1, partition_workers: int = 1, mask_cache_bytes: Optional[int] = None,
+                  origin: Optional[DataOrigin] = None) -> bool:
+    """
+    Validate all data against all rules.
+    
+    `origin` is the DataOrigin `load_data_with_origin` returned with the data, if it has not changed since.
+    """
+    check_validation_settings(engine, workers, partition_workers, logger)
+    if origin is not None and not origin.matches(data):
+        logger.debug(f"Data no longer has the {origin.n_rows} rows it was loaded with, its origin is ignored")
+        origin = None
     
     logger.info(f"\n🔽 Validating data against {len(rule)} rules... 🔽")
     
-    # Check each rule (i.e. a row in the rule Excel file)
-    for idx, single_rule in rule.iterrows():
+    # Create a view of data with NaN values replaced by empty strings to match what users expect & provide
+    # Use the original data for datetime/numeric based calculations; the cleaned version is passed into validation
+    # Built once per run and limited to the columns the rules reference, then shared by every rule and partition
+    data_cleaned = build_cleaned_data(data, get_rule_columns(rule, list(data.columns)), logger)
+    
+    # Partition keys derived from "each date/month of" scopes, shared by every rule with the same date column and granularity
+    key_cache = LRUByteCache(PARTITION_KEY_CACHE_BYTES, name="Partition key cache")
+    
+    # Condition scope masks are memoized across runs in this process, keyed by scope and data version
+    if mask_cache_bytes is not None:
+        SCOPE_MASK_CACHE.resize(mask_cache_bytes)
+    
+    # Distinct values per (column, scope, partition key), shared by all rules validating the same slice
+    distinct_cache = LRUByteCache(DISTINCT_VALUE_CACHE_BYTES, name="Distinct value cache")
+    context = RunContext(data, data_cleaned, key_cache, engine, partition_workers, mask_cache=SCOPE_MASK_CACHE,
+                         distinct_cache=distinct_cache, data_version=get_data_version(data_cleaned, origin) if origin else "")
+    
+    # Compile rules into groups sharing one scope, so each scope's rows are selected once
+    plan = build_rule_plan(rule, logger)
+    logger.debug(f"Rule plan: {len(rule)} rules in {len(plan)} scope groups")
+    
+    # Data loaded in full from an unchanged cache comes with statistics, whose distinct values need no row scan
+    distinct_values = {}
+    if origin is not None and origin.stats_cache_file:
+        distinct_values = get_stats_distinct_values(plan, read_data_cache_stats(origin.stats_cache_file), data_cleaned)
+        for key, values in distinct_values.items():
+            distinct_cache.put(key, values)
+        if distinct_values:
+            logger.info(f"\n📐 Took {len(distinct_values)} distinct value sets from the cache's column statistics, without scanning their rows")
+    
+    results = execute_rule_plan(plan, context, workers, logger, distinct_values)
+    
+    passed_count, failed_count = report_rule_results(results, logger)
+    
+    logger.debug(key_cache.summary())
+    logger.debug(SCOPE_MASK_CACHE.summary())
+    logger.debug(distinct_cache.summary())
+    
+    # Summary
+    logger.info(textwrap.dedent(f"""
+        =======================================
+        === 🚀 Starting Data Validation 🚀 ===
+        =======================================
+        Total rules processed: {passed_count + failed_count}
+        ✅ Passed: {passed_count}
+        ❌ Failed: {failed_count}
+        🗂️ Scope mask cache: {context.mask_hits} hits, {context.mask_misses} misses
+        """))
+    
+    return failed_count == 0
 
-        column = single_rule["column"].strip()
-        scope = single_rule["scope"].strip()
-        
-        # parse rules to validation schema (dictionary)
-        rule_dict = parse_rules_to_validation_schema(single_rule, logger)
+
+# ---------------------------------------------------------------------
+# Chunked validation
+# ---------------------------------------------------------------------
+
+class DistinctAccumulator:
+    """
+    Distinct values of every (column, scope, partition key) slice of the data, merged chunk by chunk.
+    
+    Values are kept as read (before NaN cleaning) and in order of first appearance, so the finished slices are
+    the same as the ones an in-memory run takes from the whole column. Memory grows with the distinct values only.
+    """
+    
+    def __init__(self):
+        self.values = {}  # (column, scope, partition key) -> pd.Series of distinct raw values
+        self.partition_keys = {}  # scope -> {partition key: None}, in order of first appearance
+        self.scope_errors = {}  # scope -> error that applies to every rule of the scope
+        self.rule_errors = {}  # rule position -> error of that rule only
+        self.columns_with_nans = set()
+        self.n_rows = 0
+        self.n_chunks = 0
+    
+    def add(self, column: str, scope: str, partition_key: Any, values: Any) -> None:
+        """Merge the distinct values of one chunk into a slice."""
+        key = (column, scope, partition_key)
+        values = pd.Series(values, copy=False).reset_index(drop=True)
+        merged = self.values.get(key)
+        if merged is not None:
+            values = pd.concat([merged, values], ignore_index=True).drop_duplicates(ignore_index=True)
+        self.values[key] = values
+    
+    def get(self, column: str, scope: str, partition_key: Any) -> Any:
+        """Distinct values of a finished slice, NaN-cleaned the way the whole column would have been."""
+        values = self.values.get((column, scope, partition_key))
+        if values is None:
+            return np.array([], dtype=object)
         
-        # Create a copy of data with NaN values replaced by empty strings to match what users expect & provide
-        # Use the original data for datetime/numeric based calculations; the cleaned version is passed into validation
-        data_cleaned = data.copy() 
-        data_cleaned = data_cleaned.fillna('') 
+        if column in self.columns_with_nans:
+            # One extra missing row gives the slice the dtype its column has after filling (e.g. floats -> object)
+            values = values.reindex(range(len(values) + 1)).fillna('').iloc[:-1]
+        return values.unique()
+
+
+def accumulate_chunk(plan: List[ScopeGroup], chunk: pd.DataFrame, state: DistinctAccumulator, logger: logging.Logger) -> None:
+    """Merge the distinct values of one chunk into the slices every scope group of the plan validates."""
+    state.n_rows += len(chunk)
+    state.n_chunks += 1
+    state.columns_with_nans.update(column for column in chunk.columns if chunk[column].hasnans)
+    
+    # Conditions are evaluated on the cleaned chunk, distinct values are taken from the chunk as read
+    chunk_cleaned = build_cleaned_data(chunk, list(chunk.columns), logger)
+    
+    for group in plan:
+        scope = group.scope
+        if scope in state.scope_errors:
+            continue
+        columns = list(dict.fromkeys(planned.column for planned in group.rules))
         
-        # No scope -> validate entire column
+        # No scope -> entire column
         if scope == '':
-
-            logger.info(f"\n📏 Validating Column '{column}' on full dataset")
-            data_dict = {column: data_cleaned[column].unique()}
-            result = validate_data_single_rule(data_dict, rule_dict, logger)
-            
+            for column in columns:
+                state.add(column, scope, None, chunk[column].unique())
+        
         # Special scope options "each month/date of: <date_column>"
         elif scope.startswith("each"):
-            
-            # Check if date_column exists and is datetime type
             date_column = scope.split(":", 1)[-1].strip()
-            if date_column not in data.columns:
-                logger.error(f"🐞 Date column '{date_column}' not found in data")
-                all_passed = False
+            if date_column not in chunk.columns:
+                state.scope_errors[scope] = f"🐞 Date column '{date_column}' not found in data"
                 continue
-            if not pd.api.types.is_datetime64_any_dtype(data[date_column]):
-                logger.error(f"🐞 Column '{date_column}' is not a datetime column, found type: {data[date_column].dtype}")
-                all_passed = False
+            if not pd.api.types.is_datetime64_any_dtype(chunk[date_column]):
+                state.scope_errors[scope] = f"🐞 Column '{date_column}' is not a datetime column, found type: {chunk[date_column].dtype}"
                 continue
-            
-            # Monitor validation status for all months/dates
-            result = True
-            
-            # Validate for each date
             if scope.startswith("each date of"):
-                
-                date_values = data[date_column].dt.date.unique()
-                for date_value in date_values:
-                    logger.info(f"\n📏 Validating Column '{column}' where `{str(date_column)}` == '{str(date_value)}'")
-                    data_dict = {column: data_cleaned[data[date_column].dt.date == date_value][column].unique()} # Use original data as mask, cleaned data for validation
-                    result = validate_data_single_rule(data_dict, rule_dict, logger)
-                    if not result:
-                        result = False
-            
-            # Validate for each month           
+                granularity = "date"
             elif scope.startswith("each month of"):
-                
-                month_values = data[date_column].dt.to_period('M').unique()
-                for month_value in month_values:
-                    logger.info(f"\n📏 Validating Column '{column}' where `{str(date_column)}` == '{str(month_value)}'")
-                    data_dict = {column: data_cleaned[data[date_column].dt.to_period('M') == month_value][column].unique()} # Use original data as mask, cleaned data for validation
-                    result = validate_data_single_rule(data_dict, rule_dict, logger)
-                    if not result:
-                        result = False
-                        
+                granularity = "month"
             else:
-                logger.error(f"🐞 Unknown 'each' scope format: '{scope}', currrently only supports 'each date of: <date_column>' and 'each month of: <date_column>'")
-                result = False
+                continue  # Reported once all chunks are read
+            
+            codes, keys = derive_partition_keys(chunk[date_column], granularity)
+            state.partition_keys.setdefault(scope, {}).update(dict.fromkeys(keys))
+            for column in columns:
+                for key, positions in split_positions_by_partition(chunk[column], codes, keys):
+                    state.add(column, scope, key, chunk[column].iloc[positions])
         
-        # Regular condition scope     
+        # Regular condition scope
         else:
-            # Validate rows matching the condition
             try:
-                logger.info(f"\n📏 Validating Column '{column}' where '{scope}'")
-                data_dict = {column: data_cleaned.query(scope)[column].unique()}
-                if not data_dict[column].size:
-                    logger.warning(f"⚠️ No rows match the condition '{scope}'. Skipping this rule.")
-                    continue
-                
-                result = validate_data_single_rule(data_dict, rule_dict, logger)
-                
+                positions = select_condition_rows(chunk_cleaned, scope)
             except Exception as e:
-                logger.error(f"🐞 Failed to evaluate condition '{scope}': {e}")
-                result = False
+                state.scope_errors[scope] = e
+                continue
+            
+            for planned in group.rules:
+                if planned.position in state.rule_errors:
+                    continue
+                try:
+                    state.add(planned.column, scope, None, chunk[planned.column].take(positions).unique())
+                except Exception as e:
+                    state.rule_errors[planned.position] = e
 
-        # Count results
-        if result:
-            passed_count += 1
-        else:
-            failed_count += 1
+
+def finish_scope_group(group: ScopeGroup, state: DistinctAccumulator, engine: str, partition_workers: int) -> List[RuleResult]:
+    """Validate every rule of a scope group once all chunks have been accumulated."""
+    scope = group.scope
+    results = []
+    
+    # No scope -> validate entire column
+    if scope == '':
+        for planned in group.rules:
+            planned.log.info(f"\n📏 Validating Column '{planned.column}' on full dataset")
+            data_dict = {planned.column: state.get(planned.column, scope, None)}
+            result = validate_data_single_rule(data_dict, planned.rule_dict, planned.log, engine, planned.validators)
+            results.append(RuleResult(planned.position, result, planned.log))
+    
+    # Special scope options "each month/date of: <date_column>"
+    elif scope.startswith("each"):
+        scope_error = state.scope_errors.get(scope)
+        if scope_error:
+            for planned in group.rules:
+                planned.log.error(scope_error)
+                results.append(RuleResult(planned.position, None, planned.log))
+            return results
+        
+        if not scope.startswith(("each date of", "each month of")):
+            for planned in group.rules:
+                planned.log.error(f"🐞 Unknown 'each' scope format: '{scope}', currrently only supports 'each date of: <date_column>' and 'each month of: <date_column>'")
+                results.append(RuleResult(planned.position, False, planned.log))
+            return results
+        
+        date_column = scope.split(":", 1)[-1].strip()
+        keys = list(state.partition_keys.get(scope, ()))
+        for planned in group.rules:
+            get_values = lambda code, column=planned.column: state.get(column, scope, keys[code])
+            result = validate_partition_values(planned, date_column, keys, get_values, engine, partition_workers)
+            results.append(RuleResult(planned.position, result, planned.log))
+    
+    # Regular condition scope
+    else:
+        scope_error = state.scope_errors.get(scope)
+        for planned in group.rules:
+            def get_values(planned: PlannedRule = planned) -> Any:
+                if planned.position in state.rule_errors:
+                    raise state.rule_errors[planned.position]
+                return state.get(planned.column, scope, None)
+            results.append(validate_condition_rule(planned, scope, scope_error, get_values, engine))
+    
+    return results
+
+
+def validate_data_chunked(chunks: Iterable[pd.DataFrame], rule: pd.DataFrame, logger: logging.Logger,
+                          engine: str = "native", partition_workers: int = 1) -> bool:
+    """
+    Validate data streamed in chunks against all rules, without holding the whole dataset in memory.
+    
+    Each chunk only adds its distinct values to the slices the rules validate; verdicts are made after the last
+    chunk, so the report is the same as the one of an in-memory run.
+    """
+    check_validation_settings(engine, 1, partition_workers, logger)
+    
+    logger.info(f"\n🔽 Validating data against {len(rule)} rules in chunks... 🔽")
+    
+    # Compile rules into groups sharing one scope, so each scope's rows are selected once per chunk
+    plan = build_rule_plan(rule, logger)
+    logger.debug(f"Rule plan: {len(rule)} rules in {len(plan)} scope groups")
+    
+    state = DistinctAccumulator()
+    for chunk in chunks:
+        accumulate_chunk(plan, chunk, state, logger)
+        logger.debug(f"Accumulated chunk {state.n_chunks}: {state.n_rows} rows, {len(state.values)} distinct value slices")
+    
+    results = []
+    for group in plan:
+        results.extend(finish_scope_group(group, state, engine, partition_workers))
+    
+    passed_count, failed_count = report_rule_results(results, logger)
     
     # Summary
     logger.info(textwrap.dedent(f"""
@@ -408,7 +2941,10 @@ def validate_data(data: pd.DataFrame, rule: pd.DataFrame, logger: logging.Logger
         Total rules processed: {passed_count + failed_count}
         ✅ Passed: {passed_count}
         ❌ Failed: {failed_count}
+        🧩 Streamed {state.n_rows} rows in {state.n_chunks} chunks
         """))
+    
+    return failed_count == 0
 
 
 # ---------------------------------------------------------------------
@@ -419,16 +2955,40 @@ def run_validation(data_file: str = 'use_cache',
                    data_sheet: str = '',
                    rules_file: str = 'data/data_validation_rules.xlsx',
                    rules_sheet: str = 'rules',
-                   log_file: str = 'log/data_validation_report.log') -> None:
+                   log_file: str = 'log/data_validation_report.log',
+                   engine: str = 'native',
+                   workers: int = 1,
+                   partition_workers: int = 1,
+                   mask_cache_bytes: int = SCOPE_MASK_CACHE_BYTES,
+                   chunk_rows: Optional[int] = None,
+                   cache_content_hash: bool = False,
+                   cache_max_bytes: int = DATA_CACHE_BYTES,
+                   cache_format: str = 'parquet',
+                   cache_partition_by: Optional[str] = None,
+                   cache_partition_granularity: str = 'month',
+                   cache_stats_by_month: Optional[str] = None,
+                   excel_engine: str = 'auto') -> None:
     """
     Run data validation programmatically.
 
     Args:
-        data_file: Path to the data file. Provide the actual directory, or ingore to use the latest cached data.
-        data_sheet: Sheet name in the data file. Provide the actual sheet name in excel, or ignore if using cached file.
+        data_file: Path to the data file (Excel, CSV, Parquet, Feather/Arrow IPC or JSON Lines, detected by extension). Provide the actual directory, or ingore to use the latest cached data.
+        data_sheet: Sheet name in the data file. Provide the actual sheet name in excel, or ignore if using cached file or a non-Excel data file.
         rules_file: Path to the rules file. Ignore to use default 'data/data_validation_rules.xlsx' in the project root.
         rules_sheet: Sheet name in the rules file. Ingore to use default 'rules' sheet.
         log_file: Path to the log file. If left blank. Ingore to use default 'log/data_validation_report.log' in the project root.
+        engine: Validation engine. 'native' (default) uses vectorized pandas set operations, 'cerberus' uses the Cerberus library for every rule.
+        workers: Number of processes to spread rule groups across. Ignore to use 1 (no parallelism), e.g. use os.cpu_count() for all cores.
+        partition_workers: Number of threads validating the date/month partitions of one rule. Ignore to use 1 (no parallelism).
+        mask_cache_bytes: Memory budget in bytes for memoized condition scope masks. Ignore to use the default 64 MB.
+        chunk_rows: Validate the cache or a Parquet/CSV data file in chunks of this many rows, without loading it into memory. Ignore to load the data at once.
+        cache_content_hash: Also hash the data file's content to decide if its cache is still valid. Ignore to only compare path, sheet, size and modification time.
+        cache_max_bytes: Disk budget in bytes for data cache files, least recently used ones are evicted beyond it. Ignore to use the default 2 GB.
+        cache_format: Format of new data cache files. 'parquet' (default) is compressed, 'arrow' is uncompressed Arrow IPC that is memory-mapped on load (larger files, no decoding).
+        cache_partition_by: Date column to partition new parquet data caches by, so runs whose scopes all bound a date range only read the partitions they need. Ignore to write a single file.
+        cache_partition_granularity: Partition the data cache by 'month' (default) or 'date' of cache_partition_by.
+        cache_stats_by_month: Date column to also keep per-month distinct values of in the data cache's column statistics, for "each month of" rules. Ignore to only keep statistics of whole columns.
+        excel_engine: Excel reader of the data and rules files. 'auto' (default) uses 'calamine' when python-calamine is installed and 'openpyxl' (read-only streaming) otherwise, or 'pandas' for data read without rules; 'pandas' reads the whole sheet with pd.read_excel.
     """
     os.makedirs(os.path.dirname(rules_file), exist_ok=True)
     os.makedirs(os.path.dirname(log_file), exist_ok=True)
@@ -445,17 +3005,53 @@ def run_validation(data_file: str = 'use_cache',
         =======================================
     """))
 
-    # Load data
-    data_df = load_data(data_file, data_sheet, logger)
+    if excel_engine not in EXCEL_ENGINES:
+        logger.error(f"🐞 Unknown Excel engine '{excel_engine}', currently only supports: {', '.join(EXCEL_ENGINES)}")
+        sys.exit(1)
+    if excel_engine == "calamine" and importlib.util.find_spec("python_calamine") is None:
+        logger.error("🐞 Excel engine 'calamine' needs the python-calamine package: pip install python-calamine")
+        sys.exit(1)
 
-    # Load rules
-    rules_df = load_rules(rules_file, rules_sheet, logger)
+    check_input_files(data_file, rules_file, logger)
 
-    # Preprocess data
-    data_df_processed = preprocess_data(data_df, logger)
+    # Load rules first, so only the data columns they reference are read
+    rules_df = load_rules(rules_file, rules_sheet, logger, excel_engine)
 
-    # Run validation
-    all_passed = validate_data(data_df_processed, rules_df, logger)
+    if cache_format not in DATA_CACHE_FORMATS:
+        logger.error(f"🐞 Unknown cache format '{cache_format}', currently only supports: {', '.join(DATA_CACHE_FORMATS)}")
+        sys.exit(1)
+    if cache_partition_granularity not in ("month", "date"):
+        logger.error(f"🐞 Unknown cache partition granularity '{cache_partition_granularity}', currently only supports: month, date")
+        sys.exit(1)
+    DATA_CACHE.max_bytes = cache_max_bytes
+    DATA_CACHE.cache_format = cache_format
+    DATA_CACHE.partition_by = cache_partition_by
+    DATA_CACHE.partition_granularity = cache_partition_granularity
+    DATA_CACHE.stats_by_month = cache_stats_by_month
+
+    # Stream data chunk by chunk (preprocessing is a placeholder and not applied to chunks)
+    if chunk_rows is not None:
+        if chunk_rows < 1:
+            logger.error(f"🐞 Chunk size must be at least 1 row, got chunk_rows={chunk_rows}")
+            sys.exit(1)
+        if workers > 1:
+            logger.warning(f"⚠️ Chunked validation runs in a single process, workers={workers} is ignored")
+        chunks = iter_data_chunks(data_file, logger, rules_df, chunk_rows)
+        all_passed = validate_data_chunked(chunks, rules_df, logger, engine, partition_workers)
+    
+    else:
+        # Load data
+        data_df, origin = load_data_with_origin(data_file, data_sheet, logger, rules_df, cache_content_hash, excel_engine)
+
+        # Preprocess data (the origin is dropped if preprocessing changes the data)
+        data_df_processed, origin = preprocess_data(data_df, logger, origin)
+
+        # Run validation
+        all_passed = validate_data(data_df_processed, rules_df, logger, engine, workers, partition_workers, mask_cache_bytes, origin)
+
+    # Wait for the data cache to be written
+    DATA_CACHE.wait(logger)
+    logger.info(DATA_CACHE.summary())
 
     input("\nPress Enter to exit...")
     sys.exit(0)
@@ -473,7 +3069,8 @@ def parse_args() -> argparse.Namespace:
     # Prompt for data file if not provided
     data_file = clean_path_input(input("Enter data file path (or press Enter to use cached data): "))
     if data_file:
-        data_sheet = input("Enter data sheet name: ").strip()
+        # Only Excel workbooks have sheets
+        data_sheet = input("Enter data sheet name: ").strip() if get_data_file_format(data_file) == "excel" else ""
         data_args = [data_file, data_sheet]
     else:
         data_args = ['use_cache', '']
@@ -506,6 +3103,9 @@ def parse_args() -> argparse.Namespace:
 
 def main():
     """Main execution function."""
+    # Needed for worker processes of the PyInstaller-frozen EXE
+    multiprocessing.freeze_support()
+    
     args = parse_args()
     logger = setup_logger(args.log)
 
@@ -515,17 +3115,23 @@ def main():
         =======================================
         """))
     
-    # Load data
-    data_df = load_data(args.data[0], args.data[1], logger)
+    check_input_files(args.data[0], str(args.rule[0]), logger)
     
-    # Load rules
+    # Load rules first, so only the data columns they reference are read
     rules_df = load_rules(args.rule[0], args.rule[1], logger)
+    
+    # Load data
+    data_df, origin = load_data_with_origin(args.data[0], args.data[1], logger, rules_df)
 
-    # Preprocess data
-    data_df_processed = preprocess_data(data_df, logger)
+    # Preprocess data (the origin is dropped if preprocessing changes the data)
+    data_df_processed, origin = preprocess_data(data_df, logger, origin)
 
     # Run validation
-    validate_data(data_df_processed, rules_df, logger)
+    validate_data(data_df_processed, rules_df, logger, origin=origin)
+    
+    # Wait for the data cache to be written
+    DATA_CACHE.wait(logger)
+    logger.info(DATA_CACHE.summary())
     
     input("\nPress Enter to exit...")
     sys.exit(0)
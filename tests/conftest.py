@@ -0,0 +1,34 @@
+"""Shared fixtures: the validator is imported from the source tree, data caches live in a temporary folder."""
+
+import logging
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+import validator
+
+
+@pytest.fixture
+def logger() -> logging.Logger:
+    logger = logging.getLogger("validator-tests")
+    logger.setLevel(logging.DEBUG)
+    return logger
+
+
+@pytest.fixture
+def data_cache(tmp_path, monkeypatch) -> validator.DataCacheManager:
+    """A fresh data cache in a temporary folder, used by every loader."""
+    cache = validator.DataCacheManager(cache_dir=tmp_path / "cache")
+    monkeypatch.setattr(validator, "DATA_CACHE", cache)
+    validator.SCOPE_MASK_CACHE.clear()
+    yield cache
+    cache.join()
+
+
+def make_rules(rows) -> pd.DataFrame:
+    """Rules frame from (column, scope, allowed, contains, not_empty) rows, like a rules sheet."""
+    return pd.DataFrame(rows, columns=["column", "scope", "allowed", "contains", "not_empty"]).assign(note="")
@@ -0,0 +1,139 @@
+"""Data cache: reuse, invalidation, eviction and `use_cache` runs."""
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import List
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+import validator
+from conftest import make_rules
+
+
+@pytest.fixture
+def source(tmp_path) -> str:
+    path = str(tmp_path / "data.csv")
+    pd.DataFrame({"Code": [1, 2, 1], "Wide1": ["a", "b", "c"], "Wide2": [1.5, 2.5, 3.5]}).to_csv(path, index=False)
+    return path
+
+
+def test_use_cache_rereads_source_for_columns_the_cache_lacks(data_cache, source, logger):
+    validator.load_data(source, "", logger, make_rules([["Code", "", "[1, 2]", "", 1]]))
+    data_cache.wait(logger)
+    
+    rules = make_rules([["Wide1", "", "['a', 'b', 'c']", "", 1]])
+    data, origin = validator.load_data_with_origin("use_cache", "", logger, rules)
+    assert list(data.columns) == ["Wide1"]
+    assert validator.validate_data(data, rules, logger, origin=origin)
+    
+    chunks = list(validator.iter_data_chunks("use_cache", logger, rules, chunk_rows=2))
+    assert pd.concat(chunks)["Wide1"].tolist() == ["a", "b", "c"]
+
+
+def test_use_cache_stops_when_lacking_columns_and_source_is_gone(data_cache, source, logger):
+    validator.load_data(source, "", logger, make_rules([["Code", "", "[1, 2]", "", 1]]))
+    data_cache.wait(logger)
+    os.remove(source)
+    
+    with pytest.raises(SystemExit):
+        validator.load_data("use_cache", "", logger, make_rules([["Wide1", "", "['a']", "", 1]]))
+
+
+@pytest.mark.parametrize("partition_granularity", [None, "month", "date"])
+def test_statistics_match_the_cache_as_loaded(data_cache, source, logger, partition_granularity):
+    dates = pd.to_datetime(["2024-03-05", "2023-12-01", None, "2024-03-01", "2024-01-09", "2023-12-24"])
+    df = pd.DataFrame({"Date": dates, "Code": [1, 2, 1, 3, 2, 1], "Brand": pd.Series(["b", "a", None, "a", "c", "b"], dtype=object)})
+    data_cache.partition_by = partition_granularity and "Date"
+    data_cache.partition_granularity = partition_granularity or "month"
+    data_cache.stats_by_month = "Date"
+    data_cache.store(df, validator.get_source_fingerprint(source, ""), logger)
+    
+    cache_file = str(data_cache.latest())
+    loaded = validator.read_data_cache(cache_file)
+    expected = validator.compute_data_cache_stats(loaded, pa.Table.from_pandas(loaded, preserve_index=False), "Date")
+    assert validator.read_data_cache_stats(cache_file) == expected
+    assert expected["columns"]["Brand"]["dtype"] == "str"
+
+
+def cache_files(cache: validator.DataCacheManager) -> List[str]:
+    return sorted(name for name in os.listdir(cache.cache_dir) if name.startswith(validator.DATA_CACHE_PREFIX)
+                  and not name.endswith(validator.DATA_CACHE_STATS_SUFFIX))
+
+
+def test_changed_source_invalidates_its_cache(data_cache, source, logger):
+    rules = make_rules([["Code", "", "[1, 2]", "", 1]])
+    validator.load_data(source, "", logger, rules)
+    data_cache.wait(logger)
+    [first_cache] = cache_files(data_cache)
+    
+    validator.load_data(source, "", logger, rules)
+    assert (data_cache.hits, data_cache.misses) == (1, 1)
+    
+    pd.DataFrame({"Code": [3, 4], "Wide1": ["d", "e"], "Wide2": [0.5, 1.5]}).to_csv(source, index=False)
+    stat = os.stat(source)
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    data = validator.load_data(source, "", logger, rules)
+    data_cache.wait(logger)
+    assert data["Code"].tolist() == [3, 4]
+    assert (data_cache.hits, data_cache.misses) == (1, 2)
+    [second_cache] = cache_files(data_cache)
+    assert second_cache != first_cache  # The outdated version of the source is removed
+    assert validator.load_data("use_cache", "", logger, rules)["Code"].tolist() == [3, 4]
+
+
+def test_least_recently_used_caches_are_evicted(data_cache, tmp_path, logger):
+    sources = []
+    for i in range(3):
+        path = str(tmp_path / f"data{i}.csv")
+        pd.DataFrame({"Code": range(i, i + 1000)}).to_csv(path, index=False)
+        sources.append(path)
+        validator.load_data(path, "", logger)
+        data_cache.wait(logger)
+    sizes = {name: entry["bytes"] for name, entry in data_cache.read_index().items()}
+    assert len(sizes) == 3
+    
+    # Use the oldest cache again, then shrink the budget to two of the three cache files
+    validator.load_data(sources[0], "", logger)
+    data_cache.max_bytes = sum(sorted(sizes.values())[-2:])
+    data_cache.evict(logger)
+    
+    assert data_cache.evictions == 1
+    remaining = {entry["source"] for entry in data_cache.read_index().values()}
+    assert remaining == {str(Path(sources[0]).resolve()), str(Path(sources[2]).resolve())}
+    assert len(cache_files(data_cache)) == 2
+
+
+def test_data_saved_without_a_source_is_used_by_use_cache(data_cache, logger):
+    validator.save_data_cache(pd.DataFrame({"Code": [1, 2]}), logger)
+    validator.save_data_cache(pd.DataFrame({"Code": [5, 6, 7]}), logger)
+    
+    assert len(cache_files(data_cache)) == 1  # Like a source file, the newer data replaces the older
+    assert validator.load_data("use_cache", "", logger)["Code"].tolist() == [5, 6, 7]
+
+
+def test_concurrent_index_writers_do_not_collide(tmp_path):
+    # Separate managers share no lock, like processes sharing one cache folder
+    managers = [validator.DataCacheManager(cache_dir=tmp_path) for _ in range(8)]
+    errors = []
+    
+    def write(manager: validator.DataCacheManager, i: int) -> None:
+        try:
+            for j in range(50):
+                manager.write_index({f"cache {i}": {"bytes": j, "last_access": j}})
+        except OSError as e:
+            errors.append(e)
+    
+    threads = [threading.Thread(target=write, args=(manager, i)) for i, manager in enumerate(managers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    assert errors == []
+    with open(tmp_path / validator.DATA_CACHE_INDEX, encoding="utf-8") as f:
+        assert len(json.load(f)["entries"]) == 1  # One writer's complete index
+    assert os.listdir(tmp_path) == [validator.DATA_CACHE_INDEX]
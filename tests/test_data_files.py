@@ -0,0 +1,37 @@
+"""Non-Excel data file readers."""
+
+import json
+
+import pandas as pd
+import pytest
+
+import validator
+from conftest import make_rules
+
+
+RECORDS = [
+    {"Code": "001", "Amount": 1, "Date": "2024-01-02"},
+    {"Code": "002", "Amount": 2, "Date": "2024-01-03"},
+    {"Code": "abc", "Amount": None, "Date": "2024-02-01"},
+    {"Code": "004", "Date": "2024-02-02"},
+]
+
+
+@pytest.fixture
+def jsonl_file(tmp_path) -> str:
+    path = tmp_path / "data.jsonl"
+    path.write_text("".join(json.dumps(record) + "\n" for record in RECORDS))
+    return str(path)
+
+
+@pytest.mark.parametrize("chunk_rows", [1, 2, 3, 100])
+def test_jsonl_dtypes_do_not_depend_on_chunks(jsonl_file, logger, monkeypatch, chunk_rows):
+    monkeypatch.setattr(validator, "JSONL_CHUNK_ROWS", chunk_rows)
+    rules = make_rules([["Code", "each month: Date", "", "", 1], ["Amount", "", "[1, 2]", "", 0]])
+
+    df = validator.read_jsonl_projected(jsonl_file, rules, logger)
+
+    assert df["Code"].tolist() == ["001", "002", "abc", "004"]
+    assert df["Amount"].dtype == "float64"
+    assert df["Amount"].tolist()[:2] == [1.0, 2.0] and df["Amount"].isna().tolist()[2:] == [True, True]
+    assert pd.api.types.is_datetime64_any_dtype(df["Date"])
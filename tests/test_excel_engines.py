@@ -0,0 +1,57 @@
+"""Parity of the streaming Excel engines with `pd.read_excel` (the 'pandas' engine)."""
+
+import importlib.util
+import logging
+from datetime import datetime
+
+import openpyxl
+import pandas as pd
+import pytest
+
+from validator import EXCEL_READERS
+
+ENGINES = [engine for engine in EXCEL_READERS
+           if engine != "pandas" and (engine != "calamine" or importlib.util.find_spec("python_calamine") is not None)]
+
+# Columns of cells as written to the sheet, None being an empty cell
+COLUMNS = {
+    "numeric text": ["001", "1e3", "2", " 4"],
+    "bool text": ["TRUE", "false", None, "True"],
+    "code text": ["001", "abc", None, "002"],
+    "numbers and text": [1, "002", 3.5, None],
+    "numbers and bools": [True, 1, 0, 2],
+    "beyond int64": [1e20, 2, 3, None],
+    "beyond int64 text": ["1e20", "5", None, "7"],
+    "not quite numbers": ["1,000", "-", "nan", None],
+    "ints and missing text": [101, 102, None, "N/A"],
+    "missing ints and text": [None, 102, "N/A", 104],
+    "ints and missing": [1, None, 3, 4],
+    "ints": [1, 2, 3, 4],
+    "floats": [1.5, None, 2, 3],
+    "bools": [True, False, True, True],
+    "dates": [datetime(2025, 8, 1), datetime(2025, 8, 2), None, datetime(2025, 8, 4)],
+    "text": ["Brand 1", "Brand 2", None, "Brand 3"],
+}
+
+
+@pytest.fixture(scope="module")
+def workbook(tmp_path_factory) -> str:
+    path = str(tmp_path_factory.mktemp("excel") / "parity.xlsx")
+    workbook = openpyxl.Workbook()
+    worksheet = workbook.active
+    worksheet.title = "data"
+    worksheet.append(list(COLUMNS))
+    for row in zip(*COLUMNS.values()):
+        worksheet.append(list(row))
+    workbook.save(path)
+    return path
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_engine_matches_read_excel(workbook: str, engine: str):
+    logger = logging.getLogger(__name__)
+    expected = EXCEL_READERS["pandas"](workbook, "data", None, logger)
+    result = EXCEL_READERS[engine](workbook, "data", None, logger)
+    pd.testing.assert_frame_equal(result, expected)
+    for column in expected.columns:
+        assert [type(value) for value in result[column]] == [type(value) for value in expected[column]], column
@@ -0,0 +1,183 @@
+"""Parsing of rule cell values."""
+
+from datetime import date, datetime
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+import validator
+
+# Literal forms rule sheets hold, as `eval` used to read them
+LITERALS = [
+    "['Brand 1', 'Brand 2']",
+    r"['Brand with backslash \\ in name', 'Brand with single quote \' in name']",
+    "['NULL', 'NA', 'NAN', 'Null']",
+    "['']",
+    "[]",
+    "[1, 2.5, -3, +4, -0.5, 1e3, 0x1F]",
+    "['a', 1, None, True, False]",
+    "('a', 'b')",
+    "{'a', 'b'}",
+    "[('a', 1), ('b', 2)]",
+    "['a',\n 'b',]",
+    "'single value'",
+    "\"double quoted\"",
+    "42",
+    "-1.5",
+    "True",
+    "None",
+    "[pd.Timestamp('2025-08-01'), pd.Timestamp('2025-08-02 10:30')]",
+    "[pd.to_datetime('2025-08-01'), pd.Timestamp(year=2025, month=8, day=3)]",
+    "[datetime(2025, 8, 1), date(2025, 8, 2)]",
+    "  ['padded']  ",
+]
+
+# Expressions `eval` would have run
+REJECTED = [
+    "__import__('os').system('echo hacked')",
+    "[__import__('os')]",
+    "pd.read_csv('data.csv')",
+    "pd.Timestamp.now",
+    "'a'.upper()",
+    "().__class__.__bases__",
+    "open('data.csv')",
+    "pd.Timestamp(**{'year': 2025, 'month': 8, 'day': 1})",
+    "2 ** 1000000",
+    "[1 + 1]",
+    "[x for x in 'ab']",
+    "lambda: 1",
+    "['a'] * 3",
+    "Brand",
+]
+
+
+def as_rule_value(value):
+    """What `parse_literal` makes of a value `eval` returned: a frozenset of lists, tuples and sets, nested ones as tuples."""
+    def freeze(item):
+        return (frozenset if isinstance(item, set) else tuple)(map(freeze, item)) if isinstance(item, (list, tuple, set)) else item
+    return frozenset(map(freeze, value)) if isinstance(value, (list, tuple, set)) else value
+
+
+@pytest.mark.parametrize("text", LITERALS)
+def test_parses_every_literal_eval_accepted(text):
+    expected = eval(text.strip(), {"__builtins__": {}, "pd": pd, "datetime": datetime, "date": date})
+    assert validator.parse_literal(text) == as_rule_value(expected)
+
+
+@pytest.mark.parametrize("text", REJECTED)
+def test_rejects_anything_but_literals(text):
+    with pytest.raises((ValueError, SyntaxError)):
+        validator.parse_literal(text)
+
+
+def test_identical_cells_share_one_parsed_value():
+    assert validator.parse_literal("['a', 'b']") is validator.parse_literal("['a', 'b']")
+    assert isinstance(validator.parse_literal("['a', ['b']]"), frozenset)
+
+
+def test_rule_cells_that_do_not_parse_stop_the_run(logger):
+    with pytest.raises(SystemExit):
+        validator.parse_value("[__import__('os')]", logger)
+
+
+def test_parses_the_template_rules_like_eval():
+    template = Path(__file__).resolve().parents[1] / "data" / "data_validation_rules - template.xlsx"
+    rules = pd.read_excel(template, sheet_name="rules", keep_default_na=False)
+    cells = [cell for cell in pd.concat([rules["allowed"], rules["contains"]]) if cell.startswith(("[", "(", "{"))]
+    assert cells
+    for cell in cells:
+        try:
+            expected = as_rule_value(eval(cell, {"__builtins__": {}}))
+        except SyntaxError:
+            # Cells eval could not read (the template's quote example is missing its closing quote) still fail
+            with pytest.raises(SyntaxError):
+                validator.parse_literal(cell)
+        else:
+            assert validator.parse_literal(cell) == expected
+
+
+def as_date_list(date_range):
+    """The list of daily Timestamps date ranges were expanded to before `DateRange`."""
+    return list(pd.date_range(start=date_range.start, end=date_range.end, freq="D"))
+
+
+AUGUST = validator.DateRange(pd.Timestamp("2025-08-01"), pd.Timestamp("2025-08-31"))
+SAMPLE_VALUES = [
+    pd.Timestamp("2025-07-31"), pd.Timestamp("2025-08-01"), pd.Timestamp("2025-08-15"), pd.Timestamp("2025-08-31"),
+    pd.Timestamp("2025-09-01"), pd.Timestamp("2025-08-15 12:00"), pd.Timestamp("2025-08-15", tz="UTC"),
+    datetime(2025, 8, 2), date(2025, 8, 2), "2025-08-02", pd.NaT, None, 20250802,
+]
+
+
+@pytest.mark.parametrize("value", SAMPLE_VALUES, ids=repr)
+def test_date_range_membership_matches_the_list_of_dates(value):
+    assert (value in AUGUST) == (value in as_date_list(AUGUST))
+
+
+def test_date_range_bounds_are_inclusive_and_whole_days():
+    assert len(AUGUST) == 31
+    assert list(AUGUST) == as_date_list(AUGUST)
+    assert AUGUST.isin(pd.Series(SAMPLE_VALUES[:6]).to_numpy()).tolist() == [False, True, True, True, False, False]
+    assert AUGUST.isin(SAMPLE_VALUES).tolist() == [value in as_date_list(AUGUST) for value in SAMPLE_VALUES]
+
+
+def test_date_range_of_one_day_and_reversed_bounds():
+    day = validator.DateRange(pd.Timestamp("2025-08-01"), pd.Timestamp("2025-08-01"))
+    assert len(day) == 1 and list(day) == [pd.Timestamp("2025-08-01")]
+    
+    reversed_range = validator.DateRange(pd.Timestamp("2025-08-31"), pd.Timestamp("2025-08-01"))
+    assert len(reversed_range) == 0 and list(reversed_range) == as_date_list(reversed_range) == []
+    assert pd.Timestamp("2025-08-15") not in reversed_range
+    assert reversed_range.is_covered_by([])
+
+
+def test_date_range_bounds_with_time_of_day():
+    # Dates are whole days counted from the start, like pd.date_range
+    shifted = validator.DateRange(pd.Timestamp("2025-08-01 06:00"), pd.Timestamp("2025-08-03 05:00"))
+    assert list(shifted) == as_date_list(shifted) == [pd.Timestamp("2025-08-01 06:00"), pd.Timestamp("2025-08-02 06:00")]
+    assert pd.Timestamp("2025-08-02 06:00") in shifted and pd.Timestamp("2025-08-02") not in shifted
+
+
+def test_timezone_aware_date_range():
+    utc = validator.DateRange(pd.Timestamp("2025-08-01", tz="UTC"), pd.Timestamp("2025-08-03", tz="UTC"))
+    for value in [pd.Timestamp("2025-08-02", tz="UTC"), pd.Timestamp("2025-08-02 02:00", tz="Europe/Paris"), pd.Timestamp("2025-08-02")]:
+        assert (value in utc) == (value in as_date_list(utc))
+
+
+def test_date_range_coverage_matches_the_list_of_dates():
+    days = pd.Series(pd.date_range("2025-08-01", "2025-08-31", freq="D"))
+    assert AUGUST.is_covered_by(days.to_numpy())
+    assert AUGUST.is_covered_by(list(days) + [pd.Timestamp("2025-09-01"), "text", None])
+    assert not AUGUST.is_covered_by(days.drop(14).to_numpy())
+    assert not AUGUST.is_covered_by((days + pd.Timedelta(hours=1)).to_numpy())
+
+
+@pytest.mark.parametrize("cell, start, end", [
+    ("all dates in range: 8/1/2025 - 10/31/2025", "2025-08-01", "2025-10-31"),
+    ("all dates in range: 2025-08-01 - 2025-08-01", "2025-08-01", "2025-08-01"),
+    ("all dates in range:  2025-08-01   -  2025-09-30 ", "2025-08-01", "2025-09-30"),
+])
+def test_parses_date_range_cells(logger, cell, start, end):
+    parsed = validator.parse_value(cell, logger)
+    assert parsed == validator.DateRange(pd.Timestamp(start), pd.Timestamp(end))
+    assert validator.decode_rule_value(validator.encode_rule_value(parsed)) == parsed
+
+
+@pytest.mark.parametrize("cell", [
+    "all dates in range: 8/1/2025",
+    "all dates in range: 8/1/2025 - ",
+    "all dates in range: NaT - 8/31/2025",
+    "all dates in range: not a date - 8/31/2025",
+])
+def test_open_or_invalid_date_range_cells_stop_the_run(logger, cell):
+    with pytest.raises(SystemExit):
+        validator.parse_value(cell, logger)
+
+
+def test_date_range_rules_report_like_the_list_of_dates():
+    values = pd.Series(pd.to_datetime(["2025-08-01", "2025-09-01", "2025-08-03"])).to_numpy()
+    for rule in ({"allowed": AUGUST}, {"contains": validator.DateRange(pd.Timestamp("2025-08-01"), pd.Timestamp("2025-08-03"))}):
+        as_list = {key: as_date_list(value) for key, value in rule.items()}
+        assert validator.validate_values_native({"c": values}, {"c": rule}) == \
+            validator.validate_values_native({"c": values}, {"c": as_list})
@@ -0,0 +1,129 @@
+"""Validation of loaded data: data versions, chunked validation and rule plans."""
+
+import io
+import logging
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+import validator
+from conftest import make_rules
+
+
+def test_data_version_follows_values_not_row_labels():
+    data = pd.DataFrame({"Code": [1, 2, 3], "Brand": ["a", "b", "c"]})
+    version = validator.get_data_version(data)
+
+    assert validator.get_data_version(data.set_axis([10, 11, 12])) == version
+    edited = data.copy()
+    edited.loc[1, "Brand"] = "x"
+    assert validator.get_data_version(edited) != version
+
+
+def test_preprocessing_hands_on_the_origin_of_unchanged_data(logger):
+    data = pd.DataFrame({"Code": [1, 2, 3]})
+    origin = validator.DataOrigin(version="v1", n_rows=3)
+
+    processed, processed_origin = validator.preprocess_data(data, logger, origin)
+
+    assert processed_origin is origin
+    assert processed is not data and processed.equals(data)
+
+
+N_ROWS = 60
+
+# Rules of every kind of scope, on columns with missing values, including rules that fail
+CHUNK_RULES = [
+    ["Brand", "each month of: Date", "['Brand 1', 'Brand 2', 'Brand 3']", "['Brand 1']", 1],
+    ["Brand", "each date of: Date", "", "", 1],
+    ["Date", "", "all dates in range: 8/1/2025 - 9/30/2025", "all dates in range: 8/1/2025 - 8/10/2025", 1],
+    ["Code", "Brand == 'Brand 1'", "[0, 1]", "", ""],
+    ["Code", "", "[0, 1, 2, 3]", "[3, 4]", 1],
+    ["Num", "Code > 1", "[0.0, 1.0, 2.0, '']", "", ""],
+    ["Num", "", "", "[5.0]", 1],
+    ["Note", "Brand == 'Brand 2'", "", "['']", ""],
+    ["Missing", "Code == 1", "", "['x']", ""],
+    ["Code", "Missing > 1", "[0]", "", ""],
+]
+
+
+@pytest.fixture(scope="module")
+def chunk_source(tmp_path_factory) -> str:
+    rng = np.random.default_rng(0)
+    num = rng.integers(0, 4, N_ROWS).astype(float)
+    num[::7] = np.nan
+    data = pd.DataFrame({
+        "Brand": rng.choice(["Brand 1", "Brand 2", "Brand 3", None], N_ROWS),
+        "Date": pd.to_datetime("2025-08-01") + pd.to_timedelta(rng.integers(0, 61, N_ROWS), unit="D"),
+        "Code": rng.integers(0, 4, N_ROWS),
+        "Num": num,
+        "Note": rng.choice(["", "a", None], N_ROWS),
+    })
+    data.loc[5, "Date"] = pd.NaT
+    path = str(tmp_path_factory.mktemp("chunks") / "data.parquet")
+    pq.write_table(pa.Table.from_pandas(data, preserve_index=False), path, row_group_size=16)
+    return path
+
+
+def run_report(validate) -> str:
+    """Validation report of a run, from its first rule result up to its totals (which include timings)."""
+    buffer = io.StringIO()
+    logger = logging.getLogger("validator-report")
+    logger.handlers.clear()
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    logger.addHandler(logging.StreamHandler(buffer))
+    validate(logger)
+    report = buffer.getvalue()
+    return report[report.index("📝"):report.rindex("Total rules")]
+
+
+@pytest.mark.parametrize("chunk_rows", [1, 7, N_ROWS - 1, N_ROWS, N_ROWS + 1, 500])
+def test_chunked_report_matches_in_memory(chunk_source, chunk_rows):
+    rules = make_rules(CHUNK_RULES)
+    expected = run_report(lambda logger: validator.validate_data(
+        validator.DATA_FILE_READERS["parquet"](chunk_source, rules, logger), rules, logger))
+    report = run_report(lambda logger: validator.validate_data_chunked(
+        validator.iter_data_chunks(chunk_source, logger, rules, chunk_rows), rules, logger))
+    assert "❌" in expected
+    assert report == expected
+
+
+@pytest.mark.parametrize("from_plan_file", [False, True])
+def test_rule_plan_reparses_only_changed_rows(tmp_path, logger, monkeypatch, from_plan_file):
+    rules_file = str(tmp_path / "rules.xlsx")
+    make_rules(CHUNK_RULES).to_excel(rules_file, sheet_name="rules", index=False)
+    validator.COMPILED_RULES.clear()
+    rules = validator.load_rules(rules_file, "rules", logger)
+    if from_plan_file:
+        validator.COMPILED_RULES.clear()
+        rules = validator.load_rules(rules_file, "rules", logger)  # Loaded from the compiled rule plan next to it
+    
+    parsed = []
+    parse = validator.parse_rules_to_validation_schema
+    monkeypatch.setattr(validator, "parse_rules_to_validation_schema",
+                        lambda single_rule, rule_log: parsed.append(single_rule["column"]) or parse(single_rule, rule_log))
+    
+    def plan_rules(rule):
+        parsed.clear()
+        return [(planned.column, planned.rule_dict, planned.log.records) for group in validator.build_rule_plan(rule, logger)
+                for planned in sorted(group.rules, key=lambda planned: planned.position)]
+    
+    def fresh_plan_rules(rule):
+        fresh = rule.copy()
+        fresh.attrs = {}
+        return plan_rules(fresh)
+    
+    assert plan_rules(rules) and parsed == []
+    
+    edited = rules.copy()
+    edited.loc[3, "allowed"] = "[0, 1, 2]"
+    reordered = edited.iloc[::-1]
+    inserted = pd.concat([reordered.iloc[:2], make_rules([["Note", "", "['a', '']", "", ""]]), reordered.iloc[2:]])
+    for changed, expected_parsed in [(edited, ["Code"]), (reordered, ["Code"]), (inserted, ["Code", "Note"])]:
+        plan = plan_rules(changed)
+        assert sorted(parsed) == expected_parsed
+        assert plan == fresh_plan_rules(changed)